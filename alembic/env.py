@@ -7,7 +7,7 @@ from alembic import context
 
 from app.config import settings
 from app.database import Base
-from app.models import ProjectPlace, TravelProject, User  # noqa: F401
+from app.models import CatalogPlace, ProjectPlace, RevokedToken, TravelProject, User  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -26,6 +26,13 @@ config.set_main_option("sqlalchemy.url", _sync_sqlalchemy_url())
 
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names) -> bool:
+    # FTS5 virtual tables (and their shadow tables) are managed by hand-written migrations.
+    if type_ == "table":
+        return "_fts" not in name
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,6 +58,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -75,6 +83,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_name=include_name,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,120 @@
+"""Key travel_projects_fts documents by project id
+
+Revision ID: 06f08a39cd0f
+Revises: e6135bbfc20a
+Create Date: 2026-10-17 20:16:42.732669
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '06f08a39cd0f'
+down_revision: Union[str, Sequence[str], None] = 'e6135bbfc20a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_TRIGGERS = (
+    'project_places_fts_au',
+    'project_places_fts_ad',
+    'project_places_fts_ai',
+    'travel_projects_fts_au',
+    'travel_projects_fts_ad',
+    'travel_projects_fts_ai',
+)
+
+_PLACES_TEXT = (
+    "SELECT group_concat(coalesce(title, '') || ' ' || coalesce(notes, ''), ' ') "
+    "FROM project_places WHERE project_id = {project_id}"
+)
+
+
+def _drop_index() -> None:
+    for trigger in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS travel_projects_fts")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Documents were keyed by travel_projects.rowid, which VACUUM may renumber (no INTEGER PRIMARY KEY); key them by
+    # the project id instead, looked up through the FTS index itself.
+    _drop_index()
+    op.execute(
+        "CREATE VIRTUAL TABLE travel_projects_fts USING fts5("
+        "project_id, user_id, name, description, places, tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "INSERT INTO travel_projects_fts(travel_projects_fts, rank) VALUES ('rank', 'bm25(0.0, 0.0, 10.0, 4.0, 1.0)')"
+    )
+    op.execute(
+        "CREATE TRIGGER travel_projects_fts_ai AFTER INSERT ON travel_projects BEGIN "
+        "INSERT INTO travel_projects_fts(project_id, user_id, name, description, places) "
+        "VALUES (new.id, new.user_id, new.name, new.description, NULL); END"
+    )
+    op.execute(
+        "CREATE TRIGGER travel_projects_fts_ad AFTER DELETE ON travel_projects BEGIN "
+        "DELETE FROM travel_projects_fts WHERE travel_projects_fts MATCH ('project_id:\"' || old.id || '\"'); END"
+    )
+    op.execute(
+        "CREATE TRIGGER travel_projects_fts_au AFTER UPDATE OF name, description ON travel_projects BEGIN "
+        "UPDATE travel_projects_fts SET name = new.name, description = new.description "
+        "WHERE travel_projects_fts MATCH ('project_id:\"' || new.id || '\"'); END"
+    )
+    for trigger, event, row in (
+        ('project_places_fts_ai', 'INSERT', 'new'),
+        ('project_places_fts_ad', 'DELETE', 'old'),
+        ('project_places_fts_au', 'UPDATE OF title, notes', 'new'),
+    ):
+        op.execute(
+            f"CREATE TRIGGER {trigger} AFTER {event} ON project_places BEGIN "
+            f"UPDATE travel_projects_fts SET places = ({_PLACES_TEXT.format(project_id=f'{row}.project_id')}) "
+            f"WHERE travel_projects_fts MATCH ('project_id:\"' || {row}.project_id || '\"'); END"
+        )
+    op.execute(
+        "INSERT INTO travel_projects_fts(project_id, user_id, name, description, places) "
+        f"SELECT p.id, p.user_id, p.name, p.description, ({_PLACES_TEXT.format(project_id='p.id')}) "
+        "FROM travel_projects AS p"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_index()
+    op.execute(
+        "CREATE VIRTUAL TABLE travel_projects_fts USING fts5("
+        "user_id, name, description, places, tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute("INSERT INTO travel_projects_fts(travel_projects_fts, rank) VALUES ('rank', 'bm25(0.0, 10.0, 4.0, 1.0)')")
+    op.execute(
+        "CREATE TRIGGER travel_projects_fts_ai AFTER INSERT ON travel_projects BEGIN "
+        "INSERT INTO travel_projects_fts(rowid, user_id, name, description, places) "
+        "VALUES (new.rowid, new.user_id, new.name, new.description, NULL); END"
+    )
+    op.execute(
+        "CREATE TRIGGER travel_projects_fts_ad AFTER DELETE ON travel_projects BEGIN "
+        "DELETE FROM travel_projects_fts WHERE rowid = old.rowid; END"
+    )
+    op.execute(
+        "CREATE TRIGGER travel_projects_fts_au AFTER UPDATE OF name, description ON travel_projects BEGIN "
+        "UPDATE travel_projects_fts SET name = new.name, description = new.description WHERE rowid = new.rowid; END"
+    )
+    for trigger, event, row in (
+        ('project_places_fts_ai', 'INSERT', 'new'),
+        ('project_places_fts_ad', 'DELETE', 'old'),
+        ('project_places_fts_au', 'UPDATE OF title, notes', 'new'),
+    ):
+        op.execute(
+            f"CREATE TRIGGER {trigger} AFTER {event} ON project_places BEGIN "
+            f"UPDATE travel_projects_fts SET places = ({_PLACES_TEXT.format(project_id=f'{row}.project_id')}) "
+            f"WHERE rowid = (SELECT rowid FROM travel_projects WHERE id = {row}.project_id); END"
+        )
+    op.execute(
+        "INSERT INTO travel_projects_fts(rowid, user_id, name, description, places) "
+        f"SELECT p.rowid, p.user_id, p.name, p.description, ({_PLACES_TEXT.format(project_id='p.id')}) "
+        "FROM travel_projects AS p"
+    )
@@ -0,0 +1,50 @@
+"""Add catalog_places FTS5 index
+
+Revision ID: 5b2f9d41c7e3
+Revises: 0e087a0f8670
+Create Date: 2026-10-17 20:12:08.413275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2f9d41c7e3'
+down_revision: Union[str, Sequence[str], None] = '0e087a0f8670'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS catalog_places_fts USING fts5("
+        "title, content='catalog_places', content_rowid='external_id', tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS catalog_places_fts_ai AFTER INSERT ON catalog_places BEGIN "
+        "INSERT INTO catalog_places_fts(rowid, title) VALUES (new.external_id, new.title); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS catalog_places_fts_ad AFTER DELETE ON catalog_places BEGIN "
+        "INSERT INTO catalog_places_fts(catalog_places_fts, rowid, title) VALUES ('delete', old.external_id, old.title); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS catalog_places_fts_au AFTER UPDATE ON catalog_places BEGIN "
+        "INSERT INTO catalog_places_fts(catalog_places_fts, rowid, title) VALUES ('delete', old.external_id, old.title); "
+        "INSERT INTO catalog_places_fts(rowid, title) VALUES (new.external_id, new.title); END"
+    )
+    # Backfill the index from rows mirrored before this migration.
+    op.execute("INSERT INTO catalog_places_fts(catalog_places_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS catalog_places_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS catalog_places_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS catalog_places_fts_ai")
+    op.execute("DROP TABLE IF EXISTS catalog_places_fts")
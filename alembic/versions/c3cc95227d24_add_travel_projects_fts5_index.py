@@ -0,0 +1,80 @@
+"""Add travel_projects FTS5 index
+
+Revision ID: c3cc95227d24
+Revises: c30c7ba36150
+Create Date: 2026-10-17 20:04:52.941277
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3cc95227d24'
+down_revision: Union[str, Sequence[str], None] = 'c30c7ba36150'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS travel_projects_fts USING fts5("
+        "user_id, name, description, places, tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute("INSERT INTO travel_projects_fts(travel_projects_fts, rank) VALUES ('rank', 'bm25(0.0, 10.0, 4.0, 1.0)')")
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS travel_projects_fts_ai AFTER INSERT ON travel_projects BEGIN "
+        "INSERT INTO travel_projects_fts(rowid, user_id, name, description, places) "
+        "VALUES (new.rowid, new.user_id, new.name, new.description, NULL); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS travel_projects_fts_ad AFTER DELETE ON travel_projects BEGIN "
+        "DELETE FROM travel_projects_fts WHERE rowid = old.rowid; END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS travel_projects_fts_au AFTER UPDATE OF name, description ON travel_projects BEGIN "
+        "UPDATE travel_projects_fts SET name = new.name, description = new.description WHERE rowid = new.rowid; END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS project_places_fts_ai AFTER INSERT ON project_places BEGIN "
+        "UPDATE travel_projects_fts SET places = ("
+        "SELECT group_concat(coalesce(title, '') || ' ' || coalesce(notes, ''), ' ') "
+        "FROM project_places WHERE project_id = new.project_id) "
+        "WHERE rowid = (SELECT rowid FROM travel_projects WHERE id = new.project_id); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS project_places_fts_ad AFTER DELETE ON project_places BEGIN "
+        "UPDATE travel_projects_fts SET places = ("
+        "SELECT group_concat(coalesce(title, '') || ' ' || coalesce(notes, ''), ' ') "
+        "FROM project_places WHERE project_id = old.project_id) "
+        "WHERE rowid = (SELECT rowid FROM travel_projects WHERE id = old.project_id); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS project_places_fts_au AFTER UPDATE OF title, notes ON project_places BEGIN "
+        "UPDATE travel_projects_fts SET places = ("
+        "SELECT group_concat(coalesce(title, '') || ' ' || coalesce(notes, ''), ' ') "
+        "FROM project_places WHERE project_id = new.project_id) "
+        "WHERE rowid = (SELECT rowid FROM travel_projects WHERE id = new.project_id); END"
+    )
+    # Backfill the index from existing projects and their places.
+    op.execute(
+        "INSERT INTO travel_projects_fts(rowid, user_id, name, description, places) "
+        "SELECT p.rowid, p.user_id, p.name, p.description, ("
+        "SELECT group_concat(coalesce(pp.title, '') || ' ' || coalesce(pp.notes, ''), ' ') "
+        "FROM project_places AS pp WHERE pp.project_id = p.id) "
+        "FROM travel_projects AS p"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS project_places_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS project_places_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS project_places_fts_ai")
+    op.execute("DROP TRIGGER IF EXISTS travel_projects_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS travel_projects_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS travel_projects_fts_ai")
+    op.execute("DROP TABLE IF EXISTS travel_projects_fts")
@@ -0,0 +1,46 @@
+"""Add seen_at to catalog_places
+
+Revision ID: e3df9041a3b2
+Revises: 06f08a39cd0f
+Create Date: 2026-10-17 20:27:50.459849
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3df9041a3b2'
+down_revision: Union[str, Sequence[str], None] = '06f08a39cd0f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_FTS_UPDATE_BODY = (
+    "BEGIN "
+    "INSERT INTO catalog_places_fts(catalog_places_fts, rowid, title) VALUES ('delete', old.external_id, old.title); "
+    "INSERT INTO catalog_places_fts(rowid, title) VALUES (new.external_id, new.title); END"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows start as never seen, so the first full sync pass keeps exactly the places it lists.
+    op.add_column(
+        'catalog_places',
+        sa.Column('seen_at', sa.DateTime(timezone=True), server_default='1970-01-01 00:00:00', nullable=False),
+    )
+    op.create_index(op.f('ix_catalog_places_seen_at'), 'catalog_places', ['seen_at'], unique=False)
+    # Touching seen_at must not re-index the title.
+    op.execute("DROP TRIGGER IF EXISTS catalog_places_fts_au")
+    op.execute(f"CREATE TRIGGER catalog_places_fts_au AFTER UPDATE OF title ON catalog_places {_FTS_UPDATE_BODY}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS catalog_places_fts_au")
+    op.execute(f"CREATE TRIGGER catalog_places_fts_au AFTER UPDATE ON catalog_places {_FTS_UPDATE_BODY}")
+    op.drop_index(op.f('ix_catalog_places_seen_at'), table_name='catalog_places')
+    op.drop_column('catalog_places', 'seen_at')
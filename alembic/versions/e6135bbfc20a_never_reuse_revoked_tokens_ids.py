@@ -0,0 +1,31 @@
+"""Never reuse revoked_tokens ids
+
+Revision ID: e6135bbfc20a
+Revises: c3cc95227d24
+Create Date: 2026-10-17 20:15:45.242810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6135bbfc20a'
+down_revision: Union[str, Sequence[str], None] = 'c3cc95227d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite can only add AUTOINCREMENT by rebuilding the table; copying the rows also seeds `sqlite_sequence`.
+    with op.batch_alter_table('revoked_tokens', recreate='always', table_kwargs={'sqlite_autoincrement': True}):
+        pass
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('revoked_tokens', recreate='always', table_kwargs={'sqlite_autoincrement': False}):
+        pass
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import heapq
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class TTLCache[K: Hashable, V]:
+    """In-memory LRU cache with per-entry TTL and an optional stale window.
+
+    An entry is fresh for `ttl_seconds`, then kept as stale for another `stale_seconds` so callers can serve it
+    while refreshing it (stale-while-revalidate); `get` only returns fresh values, `lookup` returns both.
+
+    Every operation is synchronous, so it is safe to use from the event loop without a lock. Lookups are O(1);
+    inserts are amortized O(log n) whatever mix of lifetimes callers use: they purge due entries from a single
+    min-heap ordered by expiry time before enforcing the LRU bounds: `max_entries` and, when `sizeof` is given, a
+    `max_bytes` memory budget. Expiry is also checked lazily on lookup.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_bytes: int | None = None,
+        sizeof: Callable[[V], int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes if sizeof is not None else None
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, float, V, int]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, int, K]] = []
+        self._sequence = 0
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self.lookup(key)
+        if entry is None or not entry[1]:
+            return None
+        return entry[0]
+
+    def lookup(self, key: K) -> tuple[V, bool] | None:
+        """Return the value and whether it is still fresh."""
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is not None and entry[0] <= now:
+            self._discard(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        _, fresh_until, value, _ = entry
+        return value, fresh_until > now
+
+    def set(self, key: K, value: V, *, ttl_seconds: float, stale_seconds: float = 0) -> None:
+        if ttl_seconds <= 0:
+            return
+        now = self._clock()
+        lifetime = ttl_seconds + max(0, stale_seconds)
+        expires_at = now + lifetime
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        self._discard(key)
+        self._entries[key] = (expires_at, now + ttl_seconds, value, size)
+        self._bytes += size
+
+        # The sequence number breaks ties between equal deadlines, so keys themselves never need to be ordered.
+        self._sequence += 1
+        heapq.heappush(self._expiry_heap, (expires_at, self._sequence, key))
+        self._purge_expired(now)
+
+        while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            _, (*_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def pop(self, key: K) -> None:
+        self._discard(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _discard(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # Skip heap records superseded by a newer `set` of the same key.
+            if entry is not None and entry[0] == expires_at:
+                self._discard(key)
+
+        if len(heap) > 2 * self.max_entries:
+            # Overwritten and LRU-evicted keys leave outdated records behind; compact them (amortized O(log n)).
+            self._expiry_heap = self._compact(heap)
+
+    def _compact(self, heap: list[tuple[float, int, K]]) -> list[tuple[float, int, K]]:
+        latest: dict[K, tuple[float, int, K]] = {}
+        for record in heap:
+            expires_at, sequence, key = record
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires_at and sequence > latest.get(key, (0, 0))[1]:
+                latest[key] = record
+        live = list(latest.values())
+        heapq.heapify(live)
+        return live
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+
+from app.clients.artic.errors import ArtInstituteCircuitOpenError
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker for upstream calls.
+
+    Outcomes of the last `window_size` calls are tracked while closed; once at least `min_calls` were seen and the
+    failure share reaches `failure_rate_threshold`, the breaker opens and every call fails fast for `open_seconds`.
+    Then up to `half_open_max_calls` probes are let through: a successful probe closes the breaker, a failed one
+    opens it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float,
+        window_size: int,
+        min_calls: int,
+        open_seconds: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = max(1, min_calls)
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=max(1, window_size))
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def before_call(self) -> None:
+        state = self.state
+        if state is CircuitState.OPEN or (
+            state is CircuitState.HALF_OPEN and self._half_open_calls >= self.half_open_max_calls
+        ):
+            self.rejected += 1
+            raise ArtInstituteCircuitOpenError("Art Institute API circuit breaker is open")
+        if state is CircuitState.HALF_OPEN:
+            self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            self._reset()
+            return
+        self._record(failed=False)
+
+    def record_failure(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._record(failed=True)
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and self._failures / calls >= self.failure_rate_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Give back a half-open probe slot for a call that ended without an outcome (e.g. cancelled)."""
+        if self._state is CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def snapshot(self) -> dict[str, str | int | float]:
+        calls = len(self._outcomes)
+        return {
+            "state": self.state.value,
+            "window_calls": calls,
+            "window_failure_rate": self._failures / calls if calls else 0.0,
+            "rejected": self.rejected,
+        }
+
+    def _record(self, *, failed: bool) -> None:
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failed)
+        if failed:
+            self._failures += 1
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+
+    def _reset(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+        self._half_open_calls = 0
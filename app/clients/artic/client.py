@@ -1,37 +1,83 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import datetime
+import random
 import time
-from collections import OrderedDict
-from typing import ClassVar
+from collections.abc import Hashable, Iterable
+from email.utils import parsedate_to_datetime
+from typing import Any, ClassVar
 
 import httpx
+from pydantic import BaseModel
 
+from app.cache import TTLCache
+from app.clients.artic.circuit_breaker import CircuitBreaker
+from app.clients.artic.disk_cache import DiskPlaceCache
 from app.clients.artic.errors import (
     ArtInstituteBadResponseError,
+    ArtInstituteCircuitOpenError,
     ArtInstituteClientError,
     ArtInstituteNotFoundError,
     ArtInstituteRateLimitError,
     ArtInstituteTimeoutError,
 )
+from app.clients.artic.hedging import HedgePolicy
+from app.clients.artic.rate_limit import TokenBucket
 from app.clients.artic.schemas import (
     ArticPlace,
     GetPlaceRequest,
+    GetPlacesRequest,
     ListPlacesRequest,
+    PlaceData,
     PlaceResponse,
+    PlacesByIdsResponse,
     PlacesResponse,
     PlacesSearchResponse,
     SearchPlacesRequest,
 )
+from app.clients.artic.singleflight import SingleFlight
 from app.config import settings
 
 
+# Upstream caps `limit` (and therefore `ids=`) at 100 records per request.
+MAX_IDS_PER_REQUEST = 100
+
+
 class ArtInstituteClient:
-    _shared_client: ClassVar[httpx.AsyncClient | None] = None
-    _shared_client_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    # Pooled connections belong to the event loop that opened them, so there is one shared client per loop.
+    _shared_clients: ClassVar[dict[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+    _cache: ClassVar[TTLCache[int, ArticPlace]] = TTLCache(max_entries=settings.artic_cache_max_entries)
+    _not_found_cache: ClassVar[TTLCache[int, bool]] = TTLCache(max_entries=settings.artic_cache_max_entries)
+    _disk_cache: ClassVar[DiskPlaceCache | None] = None
+    _background_tasks: ClassVar[set[asyncio.Task[None]]] = set()
 
-    _cache: ClassVar[OrderedDict[int, tuple[float, ArticPlace]]] = OrderedDict()
-    _cache_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    # List/search pages keyed by their normalized query; sized by serialized JSON length.
+    _response_cache: ClassVar[TTLCache[tuple[Hashable, ...], Any]] = TTLCache(
+        max_entries=settings.artic_response_cache_max_entries,
+        max_bytes=settings.artic_response_cache_max_bytes,
+        sizeof=lambda response: len(response.model_dump_json()),
+    )
+
+    _singleflight: ClassVar[SingleFlight] = SingleFlight()
+    _circuit_breaker: ClassVar[CircuitBreaker] = CircuitBreaker(
+        failure_rate_threshold=settings.artic_circuit_breaker_failure_rate,
+        window_size=settings.artic_circuit_breaker_window_size,
+        min_calls=settings.artic_circuit_breaker_min_calls,
+        open_seconds=settings.artic_circuit_breaker_open_seconds,
+    )
+    _hedge_policy: ClassVar[HedgePolicy] = HedgePolicy(
+        percentile=settings.artic_hedging_percentile,
+        fallback_delay_seconds=settings.artic_hedging_fallback_delay_seconds,
+        max_ratio=settings.artic_hedging_max_ratio,
+    )
+    _rate_limiter: ClassVar[TokenBucket] = TokenBucket(
+        rate=settings.artic_rate_limit_per_second,
+        burst=settings.artic_rate_limit_burst,
+        max_wait_seconds=settings.artic_api_timeout_seconds,
+    )
 
     def __init__(
         self,
@@ -51,35 +97,149 @@ class ArtInstituteClient:
 
     async def get_place(self, external_id: int) -> ArticPlace:
         if settings.artic_cache_enabled:
+            if self._not_found_cache.get(external_id):
+                raise ArtInstituteNotFoundError("Place not found")
             cached = await self._cache_get(external_id)
             if cached is not None:
                 return cached
 
+        return await self._singleflight.do(("place", external_id), lambda: self._fetch_place(external_id))
+
+    async def get_place_response(self, external_id: int) -> PlaceResponse:
+        """Cached equivalent of upstream `GET /places/{id}` (`data: {id, title, api_link}`)."""
+        place = await self.get_place(external_id)
+        return PlaceResponse(data=PlaceData.model_validate(place, from_attributes=True))
+
+    async def get_places(self, external_ids: Iterable[int]) -> dict[int, ArticPlace | None]:
+        """Resolve several places at once; IDs unknown upstream map to `None`.
+
+        Cached places are served from memory, the rest are fetched in chunked `/places?ids=` requests.
+        """
+        ids = list(dict.fromkeys(external_ids))
+        places: dict[int, ArticPlace | None] = {}
+        misses: list[int] = []
+        for external_id in ids:
+            if settings.artic_cache_enabled and self._not_found_cache.get(external_id):
+                places[external_id] = None
+                continue
+            cached = await self._cache_get(external_id) if settings.artic_cache_enabled else None
+            if cached is not None:
+                places[external_id] = cached
+            else:
+                misses.append(external_id)
+
+        chunk_size = max(1, min(settings.artic_batch_size, MAX_IDS_PER_REQUEST))
+        chunks = [misses[i : i + chunk_size] for i in range(0, len(misses), chunk_size)]
+        semaphore = asyncio.Semaphore(max(1, settings.artic_max_concurrent_requests))
+
+        async def fetch(chunk: list[int]) -> list[ArticPlace]:
+            async with semaphore:
+                return await self._singleflight.do(("places", tuple(chunk)), lambda: self._fetch_places_chunk(chunk))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(fetch(chunk)) for chunk in chunks]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+
+        fetched = {place.id: place for task in tasks for place in task.result()}
+        for external_id in misses:
+            place = fetched.get(external_id)
+            places[external_id] = place
+            if not settings.artic_cache_enabled:
+                continue
+            if place is None:
+                await self._remember_not_found(external_id)
+            else:
+                await self._cache_set(external_id, place)
+
+        return {external_id: places[external_id] for external_id in ids}
+
+    async def list_places(self, *, limit: int = 12, page: int = 1, use_cache: bool = True) -> PlacesResponse:
+        request = ListPlacesRequest(limit=limit, page=page)
+        if not use_cache:
+            return await self._fetch(request.path, request.query_params(), PlacesResponse)
+        return await self._cached_response(("list", limit, page), request.path, request.query_params(), PlacesResponse)
+
+    async def search_places(self, *, q: str, limit: int = 12, page: int = 1) -> PlacesSearchResponse:
+        # Upstream search is case-insensitive, so equivalent queries share one cache entry.
+        request = SearchPlacesRequest(q=" ".join(q.split()).casefold(), limit=limit, page=page)
+        return await self._cached_response(
+            ("search", request.q, limit, page),
+            request.path,
+            request.query_params(),
+            PlacesSearchResponse,
+        )
+
+    @classmethod
+    def singleflight_stats(cls) -> dict[str, int]:
+        return cls._singleflight.stats()
+
+    @classmethod
+    def circuit_breaker_state(cls) -> dict[str, str | int | float]:
+        return cls._circuit_breaker.snapshot()
+
+    @classmethod
+    def hedging_stats(cls) -> dict[str, int | float]:
+        return cls._hedge_policy.stats()
+
+    @classmethod
+    def cache_stats(cls) -> dict[str, dict[str, int | float]]:
+        return {
+            "places": cls._cache.stats(),
+            "not_found": cls._not_found_cache.stats(),
+            "responses": cls._response_cache.stats(),
+        }
+
+    async def _cached_response[ResponseT: BaseModel](
+        self,
+        key: tuple[Hashable, ...],
+        path: str,
+        params: dict[str, str],
+        model: type[ResponseT],
+    ) -> ResponseT:
+        if settings.artic_cache_enabled:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                return cached
+
+        async def fetch() -> ResponseT:
+            response = await self._fetch(path, params, model)
+            if settings.artic_cache_enabled:
+                self._response_cache.set(
+                    key,
+                    response,
+                    ttl_seconds=max(0, settings.artic_response_cache_ttl_seconds),
+                )
+            return response
+
+        return await self._singleflight.do(key, fetch)
+
+    async def _fetch_place(self, external_id: int) -> ArticPlace:
         request = GetPlaceRequest(external_id=external_id)
-        response = await self._request("GET", request.path, params=request.query_params())
         try:
-            payload = PlaceResponse.model_validate(response.json())
-        except Exception as exc:
-            raise ArtInstituteBadResponseError("Invalid response format from Art Institute API") from exc
+            payload = await self._fetch(request.path, request.query_params(), PlaceResponse)
+        except ArtInstituteNotFoundError:
+            if settings.artic_cache_enabled:
+                await self._remember_not_found(external_id)
+            raise
 
-        place = ArticPlace(id=payload.data.id, title=payload.data.title)
+        place = ArticPlace.model_validate(payload.data, from_attributes=True)
         if settings.artic_cache_enabled:
             await self._cache_set(external_id, place)
         return place
 
-    async def list_places(self, *, limit: int = 12, page: int = 1) -> PlacesResponse:
-        request = ListPlacesRequest(limit=limit, page=page)
-        response = await self._request("GET", request.path, params=request.query_params())
-        try:
-            return PlacesResponse.model_validate(response.json())
-        except Exception as exc:
-            raise ArtInstituteBadResponseError("Invalid response format from Art Institute API") from exc
+    async def _fetch_places_chunk(self, external_ids: list[int]) -> list[ArticPlace]:
+        request = GetPlacesRequest(ids=tuple(external_ids))
+        payload = await self._fetch(request.path, request.query_params(), PlacesByIdsResponse)
+        return [ArticPlace.model_validate(item, from_attributes=True) for item in payload.data]
 
-    async def search_places(self, *, q: str, limit: int = 12, page: int = 1) -> PlacesSearchResponse:
-        request = SearchPlacesRequest(q=q, limit=limit, page=page)
-        response = await self._request("GET", request.path, params=request.query_params())
+    async def _fetch[ResponseT: BaseModel](
+        self, path: str, params: dict[str, str], model: type[ResponseT]
+    ) -> ResponseT:
+        response = await self._request("GET", path, params=params)
         try:
-            return PlacesSearchResponse.model_validate(response.json())
+            return model.model_validate(response.json())
         except Exception as exc:
             raise ArtInstituteBadResponseError("Invalid response format from Art Institute API") from exc
 
@@ -94,16 +254,118 @@ class ArtInstituteClient:
             base_url=self._base_url_override,
             timeout_seconds=self._timeout_override,
         )
+        max_attempts = max(1, settings.artic_retry_max_attempts)
+        attempt = 1
+        while True:
+            # Outside the retry handling: the local token bucket fails fast instead of being retried, and its wait
+            # happens before the circuit breaker hands out a half-open probe slot.
+            await self._rate_limiter.acquire()
+            try:
+                return await self._send(client, method, path, params=params)
+            except (ArtInstituteNotFoundError, ArtInstituteBadResponseError, ArtInstituteCircuitOpenError):
+                raise
+            except ArtInstituteClientError as exc:
+                delay = self._retry_delay(exc, attempt)
+                if attempt >= max_attempts or delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        breaker = self._circuit_breaker
+        breaker.before_call()
         try:
-            response = await client.request(method, path, params=params)
+            if method == "GET" and settings.artic_hedging_enabled:
+                response = await self._hedged_get(client, path, params=params)
+            else:
+                response = await client.request(method, path, params=params)
         except httpx.TimeoutException as exc:
+            breaker.record_failure()
             raise ArtInstituteTimeoutError("Art Institute API timeout") from exc
         except httpx.HTTPError as exc:
+            breaker.record_failure()
             raise ArtInstituteClientError("Art Institute API request failed") from exc
+        except BaseException:
+            breaker.release()
+            raise
 
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
         self._raise_for_status(response)
         return response
 
+    async def _hedged_get(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a second identical GET if the first is slower than the hedge delay; first success wins.
+
+        The hedge needs both a hedge credit and an immediately available rate-limit token, so hedging never delays
+        the primary request or pushes us over the upstream quota. The losing request is cancelled.
+        """
+        policy = self._hedge_policy
+        policy.start_request()
+        started = time.monotonic()
+        primary = asyncio.create_task(client.request("GET", path, params=params))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=policy.delay())
+            if not done and policy.try_hedge() and self._rate_limiter.try_acquire():
+                tasks.add(asyncio.create_task(client.request("GET", path, params=params)))
+
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            policy.hedge_wins += 1
+                        policy.observe(time.monotonic() - started)
+                        return task.result()
+            # Both attempts failed: surface the primary's error.
+            return primary.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _retry_delay(exc: ArtInstituteClientError, attempt: int) -> float | None:
+        """Full-jitter exponential backoff; `Retry-After` wins when upstream sends it.
+
+        Returns `None` when upstream asks us to wait longer than the backoff cap, so the caller fails fast instead.
+        """
+        max_delay = settings.artic_retry_backoff_max_seconds
+        retry_after = exc.retry_after if isinstance(exc, ArtInstituteRateLimitError) else None
+        if retry_after is not None:
+            return retry_after if retry_after <= max_delay else None
+        return random.uniform(0, min(max_delay, settings.artic_retry_backoff_base_seconds * 2 ** (attempt - 1)))
+
+    @classmethod
+    async def warm_up(cls) -> None:
+        """Open pooled connections (DNS, TCP, TLS) before the first real request; best effort."""
+        if not cls._rate_limiter.try_acquire():
+            return
+        client = await cls._get_shared_client(base_url=None, timeout_seconds=None)
+        request = ListPlacesRequest(limit=1, fields=("id",))
+        with contextlib.suppress(httpx.HTTPError):
+            await client.get(
+                request.path,
+                params=request.query_params(),
+                timeout=settings.artic_warmup_timeout_seconds,
+            )
+
     @classmethod
     async def _get_shared_client(
         cls,
@@ -111,61 +373,113 @@ class ArtInstituteClient:
         base_url: str | None,
         timeout_seconds: float | None,
     ) -> httpx.AsyncClient:
-        if cls._shared_client is not None:
-            return cls._shared_client
-
-        async with cls._shared_client_lock:
-            if cls._shared_client is not None:
-                return cls._shared_client
-
-            cls._shared_client = httpx.AsyncClient(
+        loop = asyncio.get_running_loop()
+        client = cls._shared_clients.get(loop)
+        if client is None:
+            # Registered before the first await, so concurrent callers on this loop share one client.
+            client = cls._shared_clients[loop] = httpx.AsyncClient(
                 base_url=(base_url or settings.artic_api_base_url).rstrip("/"),
                 timeout=httpx.Timeout(timeout_seconds or settings.artic_api_timeout_seconds),
+                limits=httpx.Limits(
+                    max_connections=settings.artic_http_max_connections,
+                    max_keepalive_connections=settings.artic_http_max_keepalive_connections,
+                    keepalive_expiry=settings.artic_http_keepalive_expiry_seconds,
+                ),
+                http2=settings.artic_http2_enabled,
             )
-            return cls._shared_client
+            await cls._close_orphaned_clients()
+        return client
 
     @classmethod
     async def aclose_shared(cls) -> None:
-        async with cls._shared_client_lock:
-            if cls._shared_client is not None:
-                await cls._shared_client.aclose()
-                cls._shared_client = None
+        client = cls._shared_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        await cls._close_orphaned_clients()
+
+        if cls._disk_cache is not None:
+            await cls._disk_cache.close()
+            cls._disk_cache = None
 
     @classmethod
-    async def _cache_get(cls, external_id: int) -> ArticPlace | None:
-        now = time.monotonic()
-        async with cls._cache_lock:
-            entry = cls._cache.get(external_id)
-            if entry is None:
-                return None
-            expires_at, place = entry
-            if expires_at <= now:
-                cls._cache.pop(external_id, None)
-                return None
-            cls._cache.move_to_end(external_id)
+    async def _close_orphaned_clients(cls) -> None:
+        """Close clients left behind by event loops that ended without `aclose_shared` (e.g. one per test)."""
+        for loop, client in list(cls._shared_clients.items()):
+            if loop.is_closed():
+                del cls._shared_clients[loop]
+                # Best effort: transports of a closed loop may refuse to schedule their close callbacks.
+                with contextlib.suppress(RuntimeError):
+                    await client.aclose()
+
+    async def _cache_get(self, external_id: int) -> ArticPlace | None:
+        entry = self._cache.lookup(external_id)
+        if entry is not None:
+            place, is_fresh = entry
+            if not is_fresh:
+                # Stale-while-revalidate: answer now, refresh upstream in the background.
+                self._revalidate_in_background(external_id)
             return place
 
-    @classmethod
-    async def _cache_set(cls, external_id: int, place: ArticPlace) -> None:
-        ttl = max(0, int(settings.artic_cache_ttl_seconds))
-        if ttl == 0:
-            return
-        max_entries = max(1, int(settings.artic_cache_max_entries))
-        expires_at = time.monotonic() + ttl
+        disk_cache = self._get_disk_cache()
+        if disk_cache is None:
+            return None
+        disk_entry = await disk_cache.get(external_id)
+        if disk_entry is None:
+            return None
+        place, ttl_seconds = disk_entry
+        # Promoted for the lifetime left on the disk row, so the memory entry never outlives it.
+        self._cache.set(
+            external_id,
+            place,
+            ttl_seconds=ttl_seconds,
+            stale_seconds=max(0, settings.artic_cache_stale_seconds),
+        )
+        return place
+
+    async def _cache_set(self, external_id: int, place: ArticPlace) -> None:
+        ttl_seconds = max(0, int(settings.artic_cache_ttl_seconds))
+        self._not_found_cache.pop(external_id)
+        self._cache.set(
+            external_id,
+            place,
+            ttl_seconds=ttl_seconds,
+            stale_seconds=max(0, settings.artic_cache_stale_seconds),
+        )
+
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            await disk_cache.set(external_id, place, ttl_seconds=ttl_seconds)
+
+    async def _remember_not_found(self, external_id: int) -> None:
+        self._cache.pop(external_id)
+        self._not_found_cache.set(
+            external_id,
+            True,
+            ttl_seconds=max(0, settings.artic_negative_cache_ttl_seconds),
+        )
+        # Also drop the disk copy, or it would be served again once the negative entry expires.
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            await disk_cache.delete(external_id)
 
-        async with cls._cache_lock:
-            cls._cache[external_id] = (expires_at, place)
-            cls._cache.move_to_end(external_id)
+    def _revalidate_in_background(self, external_id: int) -> None:
+        task = asyncio.create_task(self._revalidate(external_id))
+        # The event loop only keeps weak references to tasks.
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
-            # First, remove expired entries.
-            now = time.monotonic()
-            expired_keys = [k for k, (exp, _) in cls._cache.items() if exp <= now]
-            for k in expired_keys:
-                cls._cache.pop(k, None)
+    async def _revalidate(self, external_id: int) -> None:
+        # Failures keep serving the stale value until it expires; a 404 is recorded by `_fetch_place`.
+        with contextlib.suppress(ArtInstituteClientError):
+            await self._singleflight.do(("place", external_id), lambda: self._fetch_place(external_id))
 
-            # Then enforce max size (simple LRU eviction).
-            while len(cls._cache) > max_entries:
-                cls._cache.popitem(last=False)
+    @classmethod
+    def _get_disk_cache(cls) -> DiskPlaceCache | None:
+        if not settings.artic_disk_cache_enabled:
+            return None
+        if cls._disk_cache is None:
+            cls._disk_cache = DiskPlaceCache(settings.artic_disk_cache_path)
+        return cls._disk_cache
 
     @staticmethod
     def _raise_for_status(response: httpx.Response) -> None:
@@ -173,10 +487,28 @@ class ArtInstituteClient:
             raise ArtInstituteNotFoundError("Place not found")
 
         if response.status_code == 429:
-            raise ArtInstituteRateLimitError("Art Institute API rate limited")
+            raise ArtInstituteRateLimitError(
+                "Art Institute API rate limited",
+                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+            )
 
         if response.status_code >= 500:
             raise ArtInstituteClientError("Art Institute API server error")
 
         if response.status_code != 200:
             raise ArtInstituteBadResponseError(f"Unexpected response status: {response.status_code}")
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given either as delta-seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.UTC)).total_seconds())
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from app.clients.artic.schemas import ArticPlace
+
+
+# Expired rows are deleted in bulk once every N writes instead of on every insert.
+PURGE_EVERY_N_WRITES = 256
+
+
+class DiskPlaceCache:
+    """SQLite-backed second cache tier for Art Institute places.
+
+    The file is shared by every worker process on the host (WAL mode, so readers never block the writer) and
+    survives restarts. Expiry uses wall-clock timestamps because monotonic clocks are not comparable across
+    processes. Blocking sqlite3 calls run in a worker thread.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.Lock()
+        self._writes = 0
+
+    async def get(self, external_id: int) -> tuple[ArticPlace, float] | None:
+        """Return the cached place and its remaining TTL in seconds."""
+        row = await asyncio.to_thread(self._get, external_id)
+        if row is None:
+            return None
+        payload, expires_at = row
+        return ArticPlace.model_validate_json(payload), expires_at - time.time()
+
+    async def set(self, external_id: int, place: ArticPlace, *, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        await asyncio.to_thread(self._set, external_id, place.model_dump_json(), time.time() + ttl_seconds)
+
+    async def delete(self, external_id: int) -> None:
+        await asyncio.to_thread(self._delete, external_id)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS artic_places ("
+                "external_id INTEGER PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)",
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_artic_places_expires_at ON artic_places (expires_at)")
+            self._conn = conn
+        return self._conn
+
+    def _get(self, external_id: int) -> tuple[str, float] | None:
+        with self._conn_lock:
+            return (
+                self._connect()
+                .execute(
+                    "SELECT payload, expires_at FROM artic_places WHERE external_id = ? AND expires_at > ?",
+                    (external_id, time.time()),
+                )
+                .fetchone()
+            )
+
+    def _set(self, external_id: int, payload: str, expires_at: float) -> None:
+        with self._conn_lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO artic_places (external_id, payload, expires_at) VALUES (?, ?, ?)",
+                (external_id, payload, expires_at),
+            )
+            self._writes += 1
+            if self._writes % PURGE_EVERY_N_WRITES == 0:
+                conn.execute("DELETE FROM artic_places WHERE expires_at <= ?", (time.time(),))
+
+    def _delete(self, external_id: int) -> None:
+        with self._conn_lock:
+            self._connect().execute("DELETE FROM artic_places WHERE external_id = ?", (external_id,))
+
+    def _close(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -14,8 +14,14 @@ class ArtInstituteNotFoundError(ArtInstituteClientError):
 
 
 class ArtInstituteRateLimitError(ArtInstituteClientError):
-    pass
+    def __init__(self, message: str, *, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class ArtInstituteBadResponseError(ArtInstituteClientError):
     pass
+
+
+class ArtInstituteCircuitOpenError(ArtInstituteClientError):
+    pass
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+
+
+class HedgePolicy:
+    """Decides when to send a hedged (duplicate) GET and how many of them we can afford.
+
+    The hedge delay is the configured percentile of recently observed upstream latencies (a fixed fallback delay is
+    used until `min_samples` were seen). Every primary request earns `max_ratio` of a hedge credit, and each hedge
+    spends one, so at most roughly `max_ratio` of the traffic is ever duplicated.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float,
+        fallback_delay_seconds: float,
+        max_ratio: float,
+        sample_size: int = 256,
+        min_samples: int = 20,
+    ) -> None:
+        self.percentile = min(max(percentile, 0.0), 1.0)
+        self.fallback_delay_seconds = fallback_delay_seconds
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=max(1, sample_size))
+        self._delay: float | None = None
+        self._observations = 0
+        self._credit = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def delay(self) -> float:
+        if len(self._latencies) < self.min_samples:
+            return self.fallback_delay_seconds
+        if self._delay is None:
+            ordered = sorted(self._latencies)
+            self._delay = ordered[min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)]
+        return self._delay
+
+    def observe(self, latency_seconds: float) -> None:
+        self._latencies.append(latency_seconds)
+        self._observations += 1
+        # Recompute the percentile lazily, at most once per 16 samples. Counted separately from the window, whose
+        # length stops growing once it is full.
+        if self._observations % 16 == 0:
+            self._delay = None
+
+    def start_request(self) -> None:
+        self.requests += 1
+        # Cap the credit so a quiet period cannot bank a burst of hedges.
+        self._credit = min(self._credit + self.max_ratio, 1.0 + self.max_ratio)
+
+    def try_hedge(self) -> bool:
+        if self._credit < 1.0:
+            return False
+        self._credit -= 1.0
+        self.hedged += 1
+        return True
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "delay_seconds": self.delay(),
+        }
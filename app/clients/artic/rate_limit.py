@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from app.clients.artic.errors import ArtInstituteRateLimitError
+
+
+class TokenBucket:
+    """Process-wide pacing for upstream calls: `rate` requests per second with bursts of up to `burst`.
+
+    Callers reserve a token up front (the balance may go negative) and sleep until their reservation is due, so
+    waiters are served in arrival order without a lock. A caller whose wait would exceed `max_wait_seconds` fails
+    fast with `ArtInstituteRateLimitError` instead of queueing.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        max_wait_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        self._refill()
+        wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+        if wait > self.max_wait_seconds:
+            raise ArtInstituteRateLimitError("Art Institute API client-side rate limit exceeded")
+
+        self._tokens -= 1
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now."""
+        if self.rate <= 0:
+            return True
+
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
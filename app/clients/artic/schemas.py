@@ -21,6 +21,22 @@ class ArticPlace(BaseModel):
     api_link: str | None = None
 
 
+class GetPlacesRequest(BaseModel):
+    ids: tuple[int, ...] = Field(min_length=1, max_length=100)
+    fields: tuple[str, ...] = ("id", "title", "api_link")
+
+    @property
+    def path(self) -> str:
+        return "/places"
+
+    def query_params(self) -> dict[str, str]:
+        return {
+            "ids": ",".join(str(external_id) for external_id in self.ids),
+            "limit": str(len(self.ids)),
+            "fields": ",".join(self.fields),
+        }
+
+
 class ListPlacesRequest(BaseModel):
     limit: int = Field(default=12, ge=1, le=100)
     page: int = Field(default=1, ge=1)
@@ -91,6 +107,10 @@ class PlacesResponse(BaseModel):
     data: list[PlaceListItem]
 
 
+class PlacesByIdsResponse(BaseModel):
+    data: list[PlaceListItem]
+
+
 class PlacesSearchResponse(BaseModel):
     pagination: Pagination
     data: list[PlaceSearchItem]
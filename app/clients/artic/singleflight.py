@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """Collapses concurrent calls sharing a key into one in-flight upstream call.
+
+    Every caller awaiting the same key receives the same result (or exception). The shared task
+    is shielded, so a cancelled caller does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do[T](self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, int]:
+        return {"calls": self.calls, "coalesced": self.coalesced, "inflight": len(self._inflight)}
+
+    def _forget(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception as retrieved when every waiter has gone away.
+        if not future.cancelled():
+            future.exception()
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.utils import get_app_version
@@ -14,16 +16,70 @@ class Settings(BaseSettings):
     allowed_headers: list[str] = ["*"]
 
     database_url: str = "sqlite+aiosqlite:///./app.db"
+    # PRAGMAs applied to every new SQLite connection (see `app.database.apply_sqlite_pragmas`).
+    sqlite_pragmas_enabled: bool = True
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = "WAL"
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_mmap_size_bytes: int = 256 * 1024 * 1024
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    sqlite_foreign_keys: bool = True
 
     artic_api_base_url: str = "https://api.artic.edu/api/v1"
     artic_api_timeout_seconds: float = 10.0
+    artic_http_max_connections: int = 20
+    artic_http_max_keepalive_connections: int = 10
+    artic_http_keepalive_expiry_seconds: float = 60.0
+    artic_http2_enabled: bool = True
+    artic_warmup_enabled: bool = True
+    artic_warmup_timeout_seconds: float = 3.0
+    artic_retry_max_attempts: int = 3
+    artic_retry_backoff_base_seconds: float = 0.2
+    artic_retry_backoff_max_seconds: float = 5.0
+    artic_circuit_breaker_failure_rate: float = 0.5
+    artic_circuit_breaker_window_size: int = 20
+    artic_circuit_breaker_min_calls: int = 5
+    artic_circuit_breaker_open_seconds: float = 30.0
+    artic_hedging_enabled: bool = False
+    artic_hedging_percentile: float = 0.95
+    artic_hedging_fallback_delay_seconds: float = 1.0
+    artic_hedging_max_ratio: float = 0.05
+    artic_rate_limit_per_second: float = 0.9
+    artic_rate_limit_burst: int = 10
     artic_cache_enabled: bool = True
     artic_cache_ttl_seconds: int = 300
+    artic_cache_stale_seconds: int = 60
+    artic_negative_cache_ttl_seconds: int = 30
     artic_cache_max_entries: int = 1024
+    artic_response_cache_ttl_seconds: int = 60
+    artic_response_cache_max_entries: int = 512
+    artic_response_cache_max_bytes: int = 8 * 1024 * 1024
+    artic_catalog_sync_enabled: bool = False
+    artic_catalog_sync_interval_seconds: int = 6 * 60 * 60
+    artic_catalog_sync_page_delay_seconds: float = 1.0
+    artic_catalog_sync_page_size: int = 100
+    artic_catalog_sync_lock_path: str = "./catalog_sync.lock"
+    artic_search_backend: Literal["upstream", "local"] = "upstream"
+    artic_disk_cache_enabled: bool = False
+    artic_disk_cache_path: str = "./artic_cache.db"
+    artic_max_concurrent_requests: int = 5
+    artic_batch_size: int = 100
 
     jwt_secret: str = "CHANGE-ME-IN-PRODUCTION"
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 60 * 24 * 7
+    jwt_verified_cache_ttl_seconds: int = 300
+    jwt_verified_cache_max_entries: int = 10_000
+    jwt_revocation_refresh_seconds: float = 5.0
+    jwt_revocation_purge_interval_seconds: int = 60 * 60
+
+    # argon2-cffi defaults; run `python -m app.password_calibration` to pick values for the host.
+    password_hash_time_cost: int = 3
+    password_hash_memory_cost: int = 65536
+    password_hash_parallelism: int = 4
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32
 
     is_production: bool = False
 
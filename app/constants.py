@@ -3,5 +3,8 @@ PASSWORD_MAX_LENGTH = 64
 
 JWT_TOKEN_COOKIE_KEY = "token"
 
+# Response header carrying the opaque cursor of the next page of a listing.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 MIN_PLACES_PER_PROJECT = 0
 MAX_PLACES_PER_PROJECT = 10
@@ -1,10 +1,44 @@
+from typing import Any, ClassVar
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.config import settings
 
 
+def sqlite_pragmas() -> list[str]:
+    """The connection profile from settings.
+
+    WAL lets readers run alongside the single writer, and `synchronous=NORMAL` is durable in WAL mode except
+    for the last commits before a power loss. `busy_timeout` makes a writer wait for the lock instead of failing
+    at once. The page cache, mmap and in-memory temp store cut read I/O. `foreign_keys` is off by default in
+    SQLite; without it the `ondelete="CASCADE"` rules are never applied.
+    """
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        # A negative cache_size is in KiB rather than pages.
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size_bytes}",
+        f"PRAGMA temp_store={settings.sqlite_temp_store}",
+        f"PRAGMA foreign_keys={'ON' if settings.sqlite_foreign_keys else 'OFF'}",
+    ]
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in sqlite_pragmas():
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 engine = create_async_engine(settings.database_url, echo=settings.is_production)
+if engine.dialect.name == "sqlite" and settings.sqlite_pragmas_enabled:
+    event.listen(engine.sync_engine, "connect", apply_sqlite_pragmas)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -12,7 +46,13 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-Base = declarative_base()
+
+class _Model:
+    # Fetch server-generated columns (timestamps) with INSERT/UPDATE ... RETURNING, so writes need no refresh SELECT.
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_Model)
 
 
 async def get_db():
@@ -1,3 +1,5 @@
+from app.models.catalog_place import CatalogPlace as CatalogPlace
 from app.models.project_place import ProjectPlace as ProjectPlace
+from app.models.revoked_token import RevokedToken as RevokedToken
 from app.models.travel_project import TravelProject as TravelProject
 from app.models.user import User as User
@@ -0,0 +1,37 @@
+from sqlalchemy import DDL, Column, DateTime, Integer, String, event, func
+
+from app.database import Base
+
+
+class CatalogPlace(Base):
+    """Local mirror of an Art Institute `places` record, kept up to date by the catalog sync job."""
+
+    __tablename__ = "catalog_places"
+
+    external_id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String, nullable=True)
+    api_link = Column(String, nullable=True)
+
+    # Last change to the title or API link. Set by the upsert, not `onupdate`: touching `seen_at` must not bump it.
+    synced_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Start of the latest sync pass that listed this place; rows older than a finished pass were removed upstream.
+    seen_at = Column(DateTime(timezone=True), server_default="1970-01-01 00:00:00", nullable=False, index=True)
+
+
+# FTS5 index over mirrored titles (external content table, rowid = external_id), kept in sync by triggers.
+# `create_all` runs these after creating the table; the Alembic migration mirrors them.
+CATALOG_PLACES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS catalog_places_fts USING fts5("
+    "title, content='catalog_places', content_rowid='external_id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS catalog_places_fts_ai AFTER INSERT ON catalog_places BEGIN "
+    "INSERT INTO catalog_places_fts(rowid, title) VALUES (new.external_id, new.title); END",
+    "CREATE TRIGGER IF NOT EXISTS catalog_places_fts_ad AFTER DELETE ON catalog_places BEGIN "
+    "INSERT INTO catalog_places_fts(catalog_places_fts, rowid, title) VALUES ('delete', old.external_id, old.title); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS catalog_places_fts_au AFTER UPDATE OF title ON catalog_places BEGIN "
+    "INSERT INTO catalog_places_fts(catalog_places_fts, rowid, title) VALUES ('delete', old.external_id, old.title); "
+    "INSERT INTO catalog_places_fts(rowid, title) VALUES (new.external_id, new.title); END",
+)
+
+for statement in CATALOG_PLACES_FTS_DDL:
+    event.listen(CatalogPlace.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
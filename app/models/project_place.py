@@ -1,25 +1,42 @@
-import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, UniqueConstraint, Uuid, func
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    Uuid,
+    event,
+    func,
+)
 
 from app.database import Base
 
 
 class ProjectPlace(Base):
     __tablename__ = "project_places"
-    __table_args__ = (UniqueConstraint("project_id", "external_id", name="uq_project_places_project_id_external_id"),)
+    __table_args__ = (
+        UniqueConstraint("project_id", "external_id", name="uq_project_places_project_id_external_id"),
+        # Listing a project's places, oldest first, optionally filtered by `visited` (see `list_for_project`).
+        # `external_id` lookups go through the unique constraint, which is prefixed by `project_id` as well.
+        Index("ix_project_places_project_id_created_at_id", "project_id", "created_at", "id"),
+        Index("ix_project_places_project_id_visited_created_at_id", "project_id", "visited", "created_at", "id"),
+    )
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
 
     project_id = Column(
         Uuid(as_uuid=True),
         ForeignKey("travel_projects.id", ondelete="CASCADE"),
-        index=True,
         nullable=False,
     )
 
-    external_id = Column(Integer, index=True, nullable=False)
+    external_id = Column(Integer, nullable=False)
     title = Column(String, nullable=True)
 
     notes = Column(String, nullable=True)
@@ -29,10 +46,24 @@ class ProjectPlace(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    def mark_visited(self) -> None:
-        self.visited = True
-        self.visited_at = datetime.datetime.now(datetime.UTC)
 
-    def mark_unvisited(self) -> None:
-        self.visited = False
-        self.visited_at = None
+# Re-index the `places` column of the parent project's `travel_projects_fts` document (see TravelProject) whenever
+# one of its places changes. A project has at most a handful of places, so rebuilding the column is cheap.
+_REINDEX_PROJECT_PLACES = (
+    "UPDATE travel_projects_fts SET places = ("
+    "SELECT group_concat(coalesce(title, '') || ' ' || coalesce(notes, ''), ' ') "
+    "FROM project_places WHERE project_id = {row}.project_id) "
+    "WHERE travel_projects_fts MATCH ('project_id:\"' || {row}.project_id || '\"');"
+)
+
+PROJECT_PLACES_FTS_DDL = (
+    "CREATE TRIGGER IF NOT EXISTS project_places_fts_ai AFTER INSERT ON project_places BEGIN "
+    f"{_REINDEX_PROJECT_PLACES.format(row='new')} END",
+    "CREATE TRIGGER IF NOT EXISTS project_places_fts_ad AFTER DELETE ON project_places BEGIN "
+    f"{_REINDEX_PROJECT_PLACES.format(row='old')} END",
+    "CREATE TRIGGER IF NOT EXISTS project_places_fts_au AFTER UPDATE OF title, notes ON project_places BEGIN "
+    f"{_REINDEX_PROJECT_PLACES.format(row='new')} END",
+)
+
+for statement in PROJECT_PLACES_FTS_DDL:
+    event.listen(ProjectPlace.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
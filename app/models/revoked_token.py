@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, Integer, String, func
+
+from app.database import Base
+
+
+class RevokedToken(Base):
+    """An access token revoked before its expiry (e.g. on logout), identified by its `jti` claim.
+
+    Rows are only needed until `expires_at`: after that the token is rejected by signature checks anyway.
+    """
+
+    __tablename__ = "revoked_tokens"
+    # Without AUTOINCREMENT, SQLite reuses the highest id once its row is purged, and workers whose watermark is
+    # already past it would never load the new revocation.
+    __table_args__ = ({"sqlite_autoincrement": True},)
+
+    # Monotonic sequence the workers use to fetch only revocations they have not seen yet; ids are never reused.
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    jti = Column(String, unique=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), index=True, nullable=False)
+
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
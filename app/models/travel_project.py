@@ -1,28 +1,48 @@
 import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, String, Uuid, func
+from sqlalchemy import DDL, Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String, Uuid, event, func
+from sqlalchemy.orm import relationship
 
 from app.database import Base
 
 
 class TravelProject(Base):
     __tablename__ = "travel_projects"
+    # Listing a user's projects, newest first, optionally filtered by completion (see `list_for_user`). Both also
+    # serve plain `user_id` lookups, so `user_id` has no index of its own.
+    __table_args__ = (
+        Index("ix_travel_projects_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_travel_projects_user_id_is_completed_created_at_id", "user_id", "is_completed", "created_at", "id"),
+    )
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
 
-    user_id = Column(Uuid(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
+    user_id = Column(Uuid(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
-    name = Column(String, index=True, nullable=False)
+    name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     start_date = Column(Date, nullable=True)
 
     is_completed = Column(Boolean, nullable=False, default=False, server_default="0")
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Denormalized from `project_places`, maintained by `TravelProjectRepository.apply_place_counts`.
+    places_count = Column(Integer, nullable=False, default=0, server_default="0")
+    visited_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # Never lazy-loaded: read through `TravelProjectRepository.get_for_user_with_places`. Deletes cascade in the DB.
+    places = relationship(
+        "ProjectPlace",
+        order_by="(ProjectPlace.created_at, ProjectPlace.id)",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
     def mark_completed(self) -> None:
         self.is_completed = True
         self.completed_at = datetime.datetime.now(datetime.UTC)
@@ -30,3 +50,29 @@ class TravelProject(Base):
     def mark_incomplete(self) -> None:
         self.is_completed = False
         self.completed_at = None
+
+
+# FTS5 index for project search, one document per project: the owner, name, description and the titles/notes of
+# its places (kept in sync by the `project_places` triggers, see ProjectPlace). Documents are keyed by `project_id`,
+# not by rowid: VACUUM may renumber the rowids of a table without an INTEGER PRIMARY KEY. `project_id` and `user_id`
+# are indexed, so the triggers find a document and a search intersects with the owner's documents through the FTS
+# index instead of a scan, and both have zero weight in the `rank` (bm25) configured below. `create_all` runs these
+# after creating the table; the Alembic migrations mirror them.
+_FTS_DOCUMENT = "travel_projects_fts MATCH ('project_id:\"' || {row}.id || '\"')"
+
+TRAVEL_PROJECTS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS travel_projects_fts USING fts5("
+    "project_id, user_id, name, description, places, tokenize='unicode61 remove_diacritics 2')",
+    "INSERT INTO travel_projects_fts(travel_projects_fts, rank) VALUES ('rank', 'bm25(0.0, 0.0, 10.0, 4.0, 1.0)')",
+    "CREATE TRIGGER IF NOT EXISTS travel_projects_fts_ai AFTER INSERT ON travel_projects BEGIN "
+    "INSERT INTO travel_projects_fts(project_id, user_id, name, description, places) "
+    "VALUES (new.id, new.user_id, new.name, new.description, NULL); END",
+    "CREATE TRIGGER IF NOT EXISTS travel_projects_fts_ad AFTER DELETE ON travel_projects BEGIN "
+    f"DELETE FROM travel_projects_fts WHERE {_FTS_DOCUMENT.format(row='old')}; END",
+    "CREATE TRIGGER IF NOT EXISTS travel_projects_fts_au AFTER UPDATE OF name, description ON travel_projects BEGIN "
+    "UPDATE travel_projects_fts SET name = new.name, description = new.description "
+    f"WHERE {_FTS_DOCUMENT.format(row='new')}; END",
+)
+
+for statement in TRAVEL_PROJECTS_FTS_DDL:
+    event.listen(TravelProject.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
@@ -8,10 +8,10 @@ from app.database import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
 
     email = Column(String, unique=True, index=True, nullable=False)
-    name = Column(String, index=True, nullable=True)
+    name = Column(String, nullable=True)
     password_hash = Column(String, nullable=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
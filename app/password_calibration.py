@@ -0,0 +1,84 @@
+"""Pick Argon2 cost parameters that hit a target hashing latency on the current hardware.
+
+Run on the production host (or an identical container) and copy the printed values into `.env`:
+
+    python -m app.password_calibration --target-ms 100
+
+Existing hashes are upgraded transparently on the next successful login (see `UserService.authenticate`).
+"""
+
+import argparse
+import sys
+import time
+
+from argon2 import PasswordHasher
+
+from app.config import settings
+
+
+# OWASP minimums for Argon2id: 19 MiB of memory with 2 iterations.
+MIN_MEMORY_COST_KIB = 19 * 1024
+MIN_TIME_COST = 2
+MAX_TIME_COST = 10
+
+
+def measure_hash_ms(*, time_cost: int, memory_cost: int, parallelism: int, samples: int = 3) -> float:
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def calibrate(*, target_ms: float, max_memory_cost: int, parallelism: int) -> tuple[int, int]:
+    """Return (time_cost, memory_cost) staying under `target_ms`, never below the OWASP minimums.
+
+    Memory is preferred over iterations (it is what makes GPU attacks expensive): memory is halved from
+    `max_memory_cost`, down to the minimum at most, until a minimal-iteration hash fits the target, then iterations
+    are added while they still fit. On hardware too slow for the target, the minimums are returned anyway.
+    """
+    memory_cost = max(max_memory_cost, MIN_MEMORY_COST_KIB)
+    while (
+        memory_cost > MIN_MEMORY_COST_KIB
+        and measure_hash_ms(time_cost=MIN_TIME_COST, memory_cost=memory_cost, parallelism=parallelism) > target_ms
+    ):
+        memory_cost = max(memory_cost // 2, MIN_MEMORY_COST_KIB)
+
+    time_cost = MIN_TIME_COST
+    while (
+        time_cost < MAX_TIME_COST
+        and measure_hash_ms(time_cost=time_cost + 1, memory_cost=memory_cost, parallelism=parallelism) <= target_ms
+    ):
+        time_cost += 1
+    return time_cost, memory_cost
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=100.0, help="target hashing latency (default: 100)")
+    parser.add_argument("--max-memory-kib", type=int, default=64 * 1024, help="memory cost ceiling (default: 65536)")
+    parser.add_argument("--parallelism", type=int, default=settings.password_hash_parallelism)
+    args = parser.parse_args()
+
+    time_cost, memory_cost = calibrate(
+        target_ms=args.target_ms,
+        max_memory_cost=args.max_memory_kib,
+        parallelism=args.parallelism,
+    )
+    took = measure_hash_ms(time_cost=time_cost, memory_cost=memory_cost, parallelism=args.parallelism)
+    print(f"# Argon2 hash takes ~{took:.0f} ms on this host (target {args.target_ms:.0f} ms)")
+    if took > args.target_ms and (time_cost, memory_cost) == (MIN_TIME_COST, MIN_MEMORY_COST_KIB):
+        print(
+            f"warning: even the OWASP minimums take ~{took:.0f} ms here, over the {args.target_ms:.0f} ms target; "
+            "raise the target or run on faster hardware rather than going below them",
+            file=sys.stderr,
+        )
+    print(f"PASSWORD_HASH_TIME_COST={time_cost}")
+    print(f"PASSWORD_HASH_MEMORY_COST={memory_cost}")
+    print(f"PASSWORD_HASH_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import datetime
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, or_, select, text, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.catalog_place import CatalogPlace
+from app.repositories.fts import prefix_match
+
+
+# FTS5's built-in `rank` column is bm25(); ordering by it lets the FTS index sort matches, with no temp B-tree.
+SEARCH_QUERY = text(
+    "SELECT c.external_id, c.title, c.api_link, catalog_places_fts.rank AS rank "
+    "FROM catalog_places_fts JOIN catalog_places AS c ON c.external_id = catalog_places_fts.rowid "
+    "WHERE catalog_places_fts MATCH :match ORDER BY catalog_places_fts.rank LIMIT :limit OFFSET :offset",
+)
+SEARCH_COUNT_QUERY = text("SELECT count(*) FROM catalog_places_fts WHERE catalog_places_fts MATCH :match")
+
+
+class CatalogPlaceRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_many(self, external_ids: Iterable[int]) -> dict[int, CatalogPlace]:
+        result = await self.session.execute(
+            select(CatalogPlace).where(CatalogPlace.external_id.in_(list(external_ids))),
+        )
+        return {place.external_id: place for place in result.scalars().all()}
+
+    async def upsert_many(self, rows: list[dict], *, seen_at: datetime.datetime) -> int:
+        """Insert new places and update changed ones, and stamp every row with `seen_at`.
+
+        Unchanged rows only get the new `seen_at`, which leaves their `synced_at` and FTS entry alone. Returns the
+        number of inserted or changed rows.
+        """
+        if not rows:
+            return 0
+        stmt = insert(CatalogPlace).values([{**row, "seen_at": seen_at} for row in rows])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CatalogPlace.external_id],
+            set_={"title": stmt.excluded.title, "api_link": stmt.excluded.api_link, "synced_at": func.now()},
+            where=or_(
+                CatalogPlace.title.is_distinct_from(stmt.excluded.title),
+                CatalogPlace.api_link.is_distinct_from(stmt.excluded.api_link),
+            ),
+        )
+        result = await self.session.execute(stmt)
+        await self.session.execute(
+            update(CatalogPlace)
+            .where(CatalogPlace.external_id.in_([row["external_id"] for row in rows]))
+            .values(seen_at=seen_at)
+            .execution_options(synchronize_session=False),
+        )
+        return result.rowcount
+
+    async def delete_not_seen_since(self, seen_at: datetime.datetime) -> int:
+        """Delete places that no sync pass has listed since `seen_at`; returns the number of deleted rows."""
+        result = await self.session.execute(
+            delete(CatalogPlace).where(CatalogPlace.seen_at < seen_at).execution_options(synchronize_session=False),
+        )
+        return result.rowcount
+
+    async def search(self, q: str, *, limit: int, offset: int) -> tuple[list[tuple[CatalogPlace, float]], int]:
+        """Rank mirrored places by BM25 over their titles; every term matches as a prefix (typeahead).
+
+        Returns the requested page as (place, score) pairs, higher score first, and the total number of matches.
+        """
+        match = prefix_match(q)
+        if not match:
+            return [], 0
+
+        total = (await self.session.execute(SEARCH_COUNT_QUERY, {"match": match})).scalar_one()
+        rows = await self.session.execute(SEARCH_QUERY, {"match": match, "limit": limit, "offset": offset})
+        places = [
+            (CatalogPlace(external_id=row.external_id, title=row.title, api_link=row.api_link), -row.rank)
+            for row in rows
+        ]
+        return places, int(total)
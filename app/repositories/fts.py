@@ -0,0 +1,12 @@
+import re
+
+
+# Runs of letters and digits, which is what the unicode61 tokenizer indexes as separate tokens.
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def prefix_match(q: str) -> str:
+    """Build an FTS5 query from free text: every term must match, as a prefix (typeahead)."""
+    # Split on punctuation like the tokenizer does ("Saint-Louis" -> saint, louis), and quote every term so user
+    # input can never be parsed as FTS5 query syntax.
+    return " ".join(f'"{term}"*' for term in _TOKEN_RE.findall(q))
@@ -0,0 +1,59 @@
+import base64
+import json
+from uuid import UUID
+
+from sqlalchemy import Select, String, tuple_, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(created_at_key: str, row_id: UUID) -> str:
+    payload = json.dumps([created_at_key, row_id.hex], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, UUID]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at_key, row_id = json.loads(payload)
+        return str(created_at_key), UUID(str(row_id))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+async def fetch_page[M](
+    session: AsyncSession,
+    query: Select[tuple[M]],
+    *,
+    model: type[M],
+    descending: bool,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> tuple[list[M], str | None]:
+    """Run `query` ordered by `(created_at, id)` and return one page plus the cursor of the next one (or None).
+
+    With a cursor, the page starts right after the encoded row (keyset pagination), so its cost does not depend on
+    how deep the page is, given an index ending in `(created_at, id)`; `offset` is kept for compatibility.
+
+    The cursor carries `created_at` exactly as stored rather than a parsed datetime: SQLite compares timestamps as
+    text, and a re-serialized value (e.g. with added microseconds) would not compare equal to the stored one.
+    """
+    created_at_key = type_coerce(model.created_at, String)
+    query = query.add_columns(created_at_key.label("cursor_created_at"))
+    if cursor is not None:
+        after = tuple_(*decode_cursor(cursor))
+        position = tuple_(created_at_key, model.id)
+        query = query.where(position < after if descending else position > after)
+    else:
+        query = query.offset(offset)
+
+    order_by = (model.created_at.desc(), model.id.desc()) if descending else (model.created_at, model.id)
+    rows = (await session.execute(query.order_by(*order_by).limit(limit + 1))).all()
+
+    items = [row[0] for row in rows[:limit]]
+    next_cursor = encode_cursor(rows[limit - 1][1], items[-1].id) if len(rows) > limit else None
+    return items, next_cursor
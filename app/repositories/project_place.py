@@ -1,9 +1,12 @@
+import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.project_place import ProjectPlace
+from app.repositories.pagination import fetch_page
 
 
 class ProjectPlaceRepository:
@@ -32,40 +35,23 @@ class ProjectPlaceRepository:
         project_id: str,
         *,
         limit: int,
-        offset: int,
+        offset: int = 0,
+        cursor: str | None = None,
         visited: bool | None = None,
-    ) -> list[ProjectPlace]:
+    ) -> tuple[list[ProjectPlace], str | None]:
+        """Oldest places first; returns the page and the cursor of the next page."""
         query = select(ProjectPlace).where(ProjectPlace.project_id == self._as_uuid(project_id))
         if visited is not None:
             query = query.where(ProjectPlace.visited.is_(visited))
-        query = query.order_by(ProjectPlace.created_at.asc()).limit(limit).offset(offset)
-
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
-
-    async def count_for_project(self, project_id: str) -> int:
-        result = await self.session.execute(
-            select(func.count(ProjectPlace.id)).where(ProjectPlace.project_id == self._as_uuid(project_id)),
-        )
-        return int(result.scalar_one())
-
-    async def count_visited_for_project(self, project_id: str) -> int:
-        result = await self.session.execute(
-            select(func.count(ProjectPlace.id)).where(
-                ProjectPlace.project_id == self._as_uuid(project_id),
-                ProjectPlace.visited.is_(True),
-            ),
-        )
-        return int(result.scalar_one())
-
-    async def any_visited_for_project(self, project_id: str) -> bool:
-        result = await self.session.execute(
-            select(func.count(ProjectPlace.id)).where(
-                ProjectPlace.project_id == self._as_uuid(project_id),
-                ProjectPlace.visited.is_(True),
-            ),
+        return await fetch_page(
+            self.session,
+            query,
+            model=ProjectPlace,
+            descending=False,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
-        return int(result.scalar_one()) > 0
 
     async def exists_external_in_project(self, project_id: str, external_id: int) -> bool:
         result = await self.session.execute(
@@ -79,15 +65,39 @@ class ProjectPlaceRepository:
     async def create(self, place: ProjectPlace) -> ProjectPlace:
         self.session.add(place)
         await self.session.flush()
-        await self.session.refresh(place)
         return place
 
+    async def create_many(self, places: list[ProjectPlace]) -> list[ProjectPlace]:
+        self.session.add_all(places)
+        await self.session.flush()
+        return places
+
     async def update(self, place: ProjectPlace, data: dict) -> ProjectPlace:
         for key, value in data.items():
             setattr(place, key, value)
         await self.session.flush()
-        await self.session.refresh(place)
         return place
 
+    async def set_visited(self, place: ProjectPlace, visited: bool) -> bool:
+        """Flip `visited` (and `visited_at`) with one conditional UPDATE ... RETURNING, copied onto `place`.
+
+        The condition is checked by the database, so of concurrent requests setting the same value only one changes
+        the row. Returns False, after reloading `place`, if the row already had that value.
+        """
+        stmt = (
+            update(ProjectPlace)
+            .where(ProjectPlace.id == place.id, ProjectPlace.visited.is_not(visited))
+            .values(visited=visited, visited_at=datetime.datetime.now(datetime.UTC) if visited else None)
+            .returning(ProjectPlace.visited, ProjectPlace.visited_at, ProjectPlace.updated_at)
+        )
+        result = await self.session.execute(stmt, execution_options={"synchronize_session": False})
+        row = result.one_or_none()
+        if row is None:
+            await self.session.refresh(place)
+            return False
+        for key, value in row._mapping.items():
+            set_committed_value(place, key, value)
+        return True
+
     async def delete(self, place: ProjectPlace) -> None:
         await self.session.delete(place)
@@ -0,0 +1,29 @@
+import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, jti: str, expires_at: datetime.datetime) -> None:
+        stmt = insert(RevokedToken).values(jti=jti, expires_at=expires_at)
+        await self.session.execute(stmt.on_conflict_do_nothing(index_elements=[RevokedToken.jti]))
+
+    async def list_active_after(self, last_id: int, now: datetime.datetime) -> list[tuple[int, str, datetime.datetime]]:
+        """Unexpired revocations with `id > last_id`, in id order."""
+        result = await self.session.execute(
+            select(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at)
+            .where(RevokedToken.id > last_id, RevokedToken.expires_at > now)
+            .order_by(RevokedToken.id),
+        )
+        return [(row.id, row.jti, row.expires_at) for row in result]
+
+    async def delete_expired(self, now: datetime.datetime) -> int:
+        result = await self.session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        return result.rowcount
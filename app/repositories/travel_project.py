@@ -1,9 +1,17 @@
+import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Select, and_, case, column, delete, not_, select, table, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.travel_project import TravelProject
+from app.repositories.fts import prefix_match
+from app.repositories.pagination import fetch_page
+
+
+TRAVEL_PROJECTS_FTS = table("travel_projects_fts", column("project_id"), column("rank"))
 
 
 class TravelProjectRepository:
@@ -29,38 +37,120 @@ class TravelProjectRepository:
         )
         return result.scalars().first()
 
+    async def get_for_user_with_places(self, user_id: str, project_id: str) -> TravelProject | None:
+        """Load the project with its places in a single joined SELECT."""
+        result = await self.session.execute(
+            select(TravelProject)
+            .options(joinedload(TravelProject.places))
+            .where(
+                TravelProject.user_id == UUID(user_id),
+                TravelProject.id == self._as_uuid(project_id),
+            ),
+        )
+        return result.unique().scalars().first()
+
     async def list_for_user(
         self,
         user_id: str,
         *,
         limit: int,
-        offset: int,
+        offset: int = 0,
+        cursor: str | None = None,
         is_completed: bool | None = None,
         q: str | None = None,
-    ) -> list[TravelProject]:
+    ) -> tuple[list[TravelProject], str | None]:
+        """Newest projects first; returns the page and the cursor of the next page.
+
+        With `q`, projects are instead ranked by full-text relevance over their name, description and places (BM25,
+        every term matched as a prefix) and paged by offset only, so no cursor is returned.
+        """
         query = select(TravelProject).where(TravelProject.user_id == UUID(user_id))
         if is_completed is not None:
             query = query.where(TravelProject.is_completed.is_(is_completed))
         if q:
-            query = query.where(TravelProject.name.ilike(f"%{q}%"))
+            return await self._search(query, user_id, q, limit=limit, offset=offset), None
 
-        query = query.order_by(TravelProject.created_at.desc()).limit(limit).offset(offset)
+        return await fetch_page(
+            self.session,
+            query,
+            model=TravelProject,
+            descending=True,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+    async def _search(self, query: Select, user_id: str, q: str, *, limit: int, offset: int) -> list[TravelProject]:
+        terms = prefix_match(q)
+        if not terms:
+            return []
+        # The owner filter runs inside the FTS index; search terms only match the weighted text columns.
+        match = f'user_id:"{UUID(user_id).hex}" AND {{name description places}}:({terms})'
+        query = (
+            query.join(TRAVEL_PROJECTS_FTS, TRAVEL_PROJECTS_FTS.c.project_id == TravelProject.id)
+            .where(text("travel_projects_fts MATCH :match").bindparams(match=match))
+            .order_by(TRAVEL_PROJECTS_FTS.c.rank)
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def create(self, project: TravelProject) -> TravelProject:
         self.session.add(project)
         await self.session.flush()
-        await self.session.refresh(project)
         return project
 
     async def update(self, project: TravelProject, data: dict) -> TravelProject:
         for key, value in data.items():
             setattr(project, key, value)
         await self.session.flush()
-        await self.session.refresh(project)
         return project
 
+    async def apply_place_counts(
+        self,
+        project: TravelProject,
+        *,
+        places_delta: int = 0,
+        visited_delta: int = 0,
+        max_places: int | None = None,
+    ) -> bool:
+        """Adjust the place counters and completion state in one atomic UPDATE ... RETURNING.
+
+        The new values are computed by the database, so concurrent requests cannot lose increments, and are copied
+        onto `project`. Returns False, changing nothing, if the new `places_count` would exceed `max_places`.
+        """
+        places_count = TravelProject.places_count + places_delta
+        visited_count = TravelProject.visited_count + visited_delta
+        completed = and_(places_count > 0, visited_count == places_count)
+
+        stmt = update(TravelProject).where(TravelProject.id == project.id)
+        if max_places is not None:
+            stmt = stmt.where(places_count <= max_places)
+        stmt = stmt.values(
+            places_count=places_count,
+            visited_count=visited_count,
+            is_completed=completed,
+            completed_at=case(
+                (not_(completed), None),
+                (TravelProject.is_completed, TravelProject.completed_at),
+                else_=datetime.datetime.now(datetime.UTC),
+            ),
+        ).returning(
+            TravelProject.places_count,
+            TravelProject.visited_count,
+            TravelProject.is_completed,
+            TravelProject.completed_at,
+            TravelProject.updated_at,
+        )
+        result = await self.session.execute(stmt, execution_options={"synchronize_session": False})
+        row = result.one_or_none()
+        if row is None:
+            return False
+        for key, value in row._mapping.items():
+            set_committed_value(project, key, value)
+        return True
+
     async def delete(self, project: TravelProject) -> None:
         await self.session.delete(project)
 
@@ -25,14 +25,12 @@ class UserRepository:
     async def create(self, user: User) -> User:
         self.session.add(user)
         await self.session.flush()
-        await self.session.refresh(user)
         return user
 
     async def update(self, user: User, data: dict) -> User:
         for key, value in data.items():
             setattr(user, key, value)
         await self.session.flush()
-        await self.session.refresh(user)
         return user
 
     async def delete_user(self, user: User) -> None:
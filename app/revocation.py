@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from collections.abc import Callable
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings: no false negatives, about `error_rate` false positives at `capacity`."""
+
+    def __init__(self, *, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[i >> 3] & (1 << (i & 7)) for i in self._positions(item))
+
+    def add(self, item: str) -> None:
+        for i in self._positions(item):
+            self._bits[i >> 3] |= 1 << (i & 7)
+
+    def _positions(self, item: str) -> list[int]:
+        # Double hashing: k positions from the two halves of a single digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+
+class RevocationList:
+    """This worker's view of revoked token IDs (`jti`), consulted on every authenticated request.
+
+    The Bloom filter answers the common case, a token that was never revoked, without touching the exact set; a
+    filter hit is confirmed against the exact set, so false positives never reject a valid token. Expiry times are
+    kept so `prune` can drop revocations of tokens that have expired anyway. Workers fill it from the database (see
+    `app.services.token_revocation`), tracking the last row they have seen in `last_id`.
+    """
+
+    def __init__(self, *, initial_capacity: int = 1024, clock: Callable[[], float] = time.time) -> None:
+        self._initial_capacity = initial_capacity
+        self._clock = clock
+        self._expires_at: dict[str, float] = {}
+        self._bloom = BloomFilter(capacity=initial_capacity)
+        self.last_id = 0
+        self.checks = 0
+        self.filter_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def add(self, jti: str, expires_at: float) -> None:
+        if jti in self._expires_at:
+            return
+        self._expires_at[jti] = expires_at
+        if len(self._expires_at) > self._bloom.capacity:
+            self._rebuild()
+        else:
+            self._bloom.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        self.checks += 1
+        if jti not in self._bloom:
+            return False
+        self.filter_hits += 1
+        return jti in self._expires_at
+
+    def prune(self) -> None:
+        now = self._clock()
+        self._expires_at = {jti: expires_at for jti, expires_at in self._expires_at.items() if expires_at > now}
+        self._rebuild()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "revoked": len(self._expires_at),
+            "checks": self.checks,
+            "filter_hits": self.filter_hits,
+            "filter_capacity": self._bloom.capacity,
+            "last_id": self.last_id,
+        }
+
+    def _rebuild(self) -> None:
+        # Bloom filters cannot delete or grow in place; size the new one with headroom for further revocations.
+        self._bloom = BloomFilter(capacity=max(self._initial_capacity, 2 * len(self._expires_at)))
+        for jti in self._expires_at:
+            self._bloom.add(jti)
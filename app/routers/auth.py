@@ -11,7 +11,8 @@ from app.schemas.auth import (
     LoginRequest,
     RegisterRequest,
 )
-from app.security import create_access_token
+from app.security import create_access_token, get_optional_access_token, revocation_list, verified_token_cache
+from app.services.token_revocation import TokenRevocationService
 from app.services.user import UserService
 
 
@@ -53,8 +54,19 @@ async def login(
     return AuthUserResponse.model_validate(user)
 
 
+@router.get("/stats")
+async def auth_stats() -> dict[str, dict]:
+    return {"verified_token_cache": verified_token_cache.stats(), "revocation_list": revocation_list.stats()}
+
+
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
-async def logout(response: Response) -> None:
+async def logout(
+    response: Response,
+    token: Annotated[str | None, Depends(get_optional_access_token)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> None:
+    if token is not None:
+        await TokenRevocationService(db).revoke(token)
     response.delete_cookie(
         key=JWT_TOKEN_COOKIE_KEY,
         httponly=True,
@@ -1,6 +1,7 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.clients.artic.client import ArtInstituteClient
 from app.clients.artic.errors import (
@@ -11,6 +12,8 @@ from app.clients.artic.errors import (
     ArtInstituteTimeoutError,
 )
 from app.clients.artic.schemas import PlaceResponse, PlacesResponse, PlacesSearchResponse
+from app.database import get_db
+from app.services.place_search import PlaceSearchService
 
 
 router = APIRouter(prefix="/external/places", tags=["external-places"])
@@ -38,12 +41,12 @@ async def list_places(
 @router.get("/search", response_model=PlacesSearchResponse)
 async def search_places(
     q: str,
+    db: Annotated[AsyncSession, Depends(get_db)],
     limit: Annotated[int, Query(ge=1, le=100)] = 12,
     page: Annotated[int, Query(ge=1)] = 1,
 ) -> PlacesSearchResponse:
-    client = ArtInstituteClient()
     try:
-        return await client.search_places(q=q, limit=limit, page=page)
+        return await PlaceSearchService(db).search(q=q, limit=limit, page=page)
     except (ArtInstituteTimeoutError, ArtInstituteRateLimitError, ArtInstituteClientError):
         from fastapi import HTTPException, status
 
@@ -54,18 +57,24 @@ async def search_places(
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from None
 
 
+@router.get("/stats")
+async def client_stats() -> dict[str, dict]:
+    # Declared before `/{external_id}` so the path is not parsed as an ID.
+    return {
+        "cache": ArtInstituteClient.cache_stats(),
+        "singleflight": ArtInstituteClient.singleflight_stats(),
+        "circuit_breaker": ArtInstituteClient.circuit_breaker_state(),
+        "hedging": ArtInstituteClient.hedging_stats(),
+    }
+
+
 @router.get("/{external_id}", response_model=PlaceResponse)
 async def get_place(
     external_id: int,
 ) -> PlaceResponse:
     client = ArtInstituteClient()
     try:
-        # Use underlying request/response model so response shape matches upstream `data: {id,title,api_link}`.
-        from app.clients.artic.schemas import GetPlaceRequest
-
-        request = GetPlaceRequest(external_id=external_id)
-        response = await client._request("GET", request.path, params=request.query_params())
-        return PlaceResponse.model_validate(response.json())
+        return await client.get_place_response(external_id)
     except ArtInstituteNotFoundError:
         from fastapi import HTTPException, status
 
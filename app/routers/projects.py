@@ -1,8 +1,9 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import NEXT_CURSOR_HEADER
 from app.database import get_db
 from app.schemas.project_place import ProjectPlaceImport, ProjectPlacePublic, ProjectPlaceUpdate
 from app.schemas.travel_project import (
@@ -24,29 +25,32 @@ async def create_project(
     user_id: Annotated[str, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> TravelProjectWithPlacesPublic:
-    service = TravelProjectService(db)
-    project = await service.create_project(user_id, payload)
-    places = await service.list_places(user_id, str(project.id), limit=100, offset=0)
-
-    return TravelProjectWithPlacesPublic.model_validate(
-        {
-            **TravelProjectPublic.model_validate(project).model_dump(),
-            "places": [ProjectPlacePublic.model_validate(p).model_dump() for p in places],
-        },
-    )
+    project = await TravelProjectService(db).create_project(user_id, payload)
+    return TravelProjectWithPlacesPublic.model_validate(project)
 
 
 @router.get("", response_model=list[TravelProjectPublic])
 async def list_projects(
     user_id: Annotated[str, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    response: Response,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: str | None = None,
     is_completed: bool | None = None,
     q: str | None = None,
 ) -> list[TravelProjectPublic]:
     service = TravelProjectService(db)
-    projects = await service.list_projects(user_id, limit=limit, offset=offset, is_completed=is_completed, q=q)
+    projects, next_cursor = await service.list_projects(
+        user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        is_completed=is_completed,
+        q=q,
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [TravelProjectPublic.model_validate(p) for p in projects]
 
 
@@ -56,16 +60,8 @@ async def get_project(
     user_id: Annotated[str, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> TravelProjectWithPlacesPublic:
-    service = TravelProjectService(db)
-    project = await service.get_project(user_id, project_id)
-    places = await service.list_places(user_id, project_id, limit=100, offset=0)
-
-    return TravelProjectWithPlacesPublic.model_validate(
-        {
-            **TravelProjectPublic.model_validate(project).model_dump(),
-            "places": [ProjectPlacePublic.model_validate(p).model_dump() for p in places],
-        },
-    )
+    project = await TravelProjectService(db).get_project_with_places(user_id, project_id)
+    return TravelProjectWithPlacesPublic.model_validate(project)
 
 
 @router.patch("/{project_id}", response_model=TravelProjectPublic)
@@ -94,12 +90,23 @@ async def list_places(
     project_id: str,
     user_id: Annotated[str, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    response: Response,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: str | None = None,
     visited: bool | None = None,
 ) -> list[ProjectPlacePublic]:
     service = TravelProjectService(db)
-    places = await service.list_places(user_id, project_id, limit=limit, offset=offset, visited=visited)
+    places, next_cursor = await service.list_places(
+        user_id,
+        project_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        visited=visited,
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [ProjectPlacePublic.model_validate(p) for p in places]
 
 
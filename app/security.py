@@ -1,4 +1,11 @@
+import asyncio
 import datetime
+import hashlib
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import jwt
 from argon2 import PasswordHasher
@@ -6,18 +13,87 @@ from argon2.exceptions import InvalidHashError, VerificationError, VerifyMismatc
 from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security.utils import get_authorization_scheme_param
 
+from app.cache import TTLCache
 from app.config import settings
 from app.constants import JWT_TOKEN_COOKIE_KEY
+from app.revocation import RevocationList
 
 
-pwd_hasher = PasswordHasher()
+pwd_hasher = PasswordHasher(
+    time_cost=settings.password_hash_time_cost,
+    memory_cost=settings.password_hash_memory_cost,
+    parallelism=settings.password_hash_parallelism,
+)
 
 
-def hash_password(password: str) -> str:
-    return pwd_hasher.hash(password)
+class PasswordHashingBusyError(HTTPException):
+    """The hashing pool is saturated; surfaces as a 503 unless the caller handles it."""
 
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent authentication requests",
+            headers={"Retry-After": "1"},
+        )
 
-def verify_password(password_hash: str, password: str) -> bool:
+
+class PasswordHashingPool:
+    """Runs Argon2 in a bounded thread pool so hashing never blocks the event loop.
+
+    argon2-cffi releases the GIL while hashing, so `workers` threads hash in parallel. Admission control caps the
+    jobs running or queued at `max_pending`; beyond that, callers get a 503 at once instead of piling up (a login
+    storm then cannot starve the rest of the API of threads and memory).
+    """
+
+    def __init__(self, *, workers: int, max_pending: int) -> None:
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self.rejected = 0
+
+    async def run[T](self, fn: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHashingBusyError()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="argon2")
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        job = self._executor.submit(fn, *args)
+        # Count the job until the thread is done with it, even if the caller is cancelled (client disconnect) and
+        # stops awaiting it. The callback runs in the worker thread, so hop back to the loop to update the counter.
+        job.add_done_callback(lambda _: loop.call_soon_threadsafe(self._job_done))
+        return await asyncio.wrap_future(job)
+
+    def _job_done(self) -> None:
+        self._pending -= 1
+
+
+password_hashing_pool = PasswordHashingPool(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hashing_pool.run(pwd_hasher.hash, password)
+
+
+async def verify_password(password_hash: str, password: str) -> bool:
+    return await password_hashing_pool.run(_verify_password, password_hash, password)
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """Whether the hash was made with cost parameters other than the current ones."""
+    try:
+        return pwd_hasher.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return False
+
+
+def _verify_password(password_hash: str, password: str) -> bool:
     try:
         return pwd_hasher.verify(password_hash, password)
     except (VerifyMismatchError, VerificationError, InvalidHashError):
@@ -28,14 +104,14 @@ def create_access_token(user_id: str) -> str:
     expires_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(
         minutes=settings.jwt_access_token_expire_minutes,
     )
-    payload = {"sub": user_id, "exp": expires_at}
+    payload = {"sub": user_id, "exp": expires_at, "jti": uuid.uuid4().hex}
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
-def get_access_token(
+def get_optional_access_token(
     request: Request,
     authorization: str | None = Header(default=None),
-) -> str:
+) -> str | None:
     cookie_token = request.cookies.get(JWT_TOKEN_COOKIE_KEY)
     if cookie_token:
         return cookie_token
@@ -43,11 +119,37 @@ def get_access_token(
     scheme, param = get_authorization_scheme_param(authorization)
     if scheme.lower() == "bearer" and param:
         return param
+    return None
+
+
+def get_access_token(token: str | None = Depends(get_optional_access_token)) -> str:
+    if token is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return token
 
-    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+
+# Tokens that already passed `jwt.decode`, keyed by their SHA-256 digest (the raw token is never kept).
+verified_token_cache: TTLCache[bytes, tuple[str, str | None]] = TTLCache(
+    max_entries=settings.jwt_verified_cache_max_entries,
+)
+# Revoked token IDs, refreshed from the database by `app.services.token_revocation`.
+revocation_list = RevocationList()
 
 
 def get_current_user_id(token: str = Depends(get_access_token)) -> str:
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = verified_token_cache.get(digest)
+    if cached is None:
+        cached = _verify_access_token(token, digest)
+
+    user_id, jti = cached
+    # Tokens issued before revocation support have no `jti` and simply expire.
+    if jti is not None and revocation_list.is_revoked(jti):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
+    return user_id
+
+
+def _verify_access_token(token: str, digest: bytes) -> tuple[str, str | None]:
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
         user_id: str = payload["sub"]
@@ -55,4 +157,9 @@ def get_current_user_id(token: str = Depends(get_access_token)) -> str:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired") from None
     except (jwt.InvalidTokenError, KeyError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from None
-    return user_id
+
+    # An entry never outlives the token's `exp`.
+    ttl_seconds = min(settings.jwt_verified_cache_ttl_seconds, payload["exp"] - time.time())
+    verified = (user_id, payload.get("jti"))
+    verified_token_cache.set(digest, verified, ttl_seconds=ttl_seconds)
+    return verified
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import os
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.artic.client import ArtInstituteClient
+from app.clients.artic.errors import ArtInstituteClientError
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.catalog_place import CatalogPlaceRepository
+
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks, so every worker process syncs.
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# How often a worker that does not hold the sync lock checks whether the holder went away.
+LOCK_RETRY_SECONDS = 60.0
+
+
+class CatalogSyncService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.catalog_repo = CatalogPlaceRepository(db)
+        self.artic = ArtInstituteClient()
+
+    async def sync_page(self, page: int, *, pass_started_at: datetime.datetime) -> tuple[int, int]:
+        """Mirror one upstream `/places` page as part of the pass started at `pass_started_at`.
+
+        Returns (inserted or changed rows, total pages).
+        """
+        response = await self.artic.list_places(
+            limit=settings.artic_catalog_sync_page_size,
+            page=page,
+            use_cache=False,
+        )
+        changed = await self.catalog_repo.upsert_many(
+            [{"external_id": item.id, "title": item.title, "api_link": item.api_link} for item in response.data],
+            seen_at=pass_started_at,
+        )
+        return changed, response.pagination.total_pages
+
+    async def prune(self, pass_started_at: datetime.datetime) -> int:
+        """Delete places that the pass started at `pass_started_at` did not list, i.e. that were removed upstream.
+
+        Only call this once every page of the pass has been mirrored.
+        """
+        return await self.catalog_repo.delete_not_seen_since(pass_started_at)
+
+
+class CatalogSyncLock:
+    """Non-blocking advisory lock on a file, so that only one worker process on the host runs the sync.
+
+    The OS releases the lock when its holder exits, so a standby worker takes over after a crash.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._fd: int | None = None
+
+    def acquire(self) -> bool:
+        if self._fd is not None or fcntl is None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+async def run_catalog_sync_forever() -> None:
+    """Continuously page through the upstream catalog, one committed page at a time.
+
+    Pages are paced by `artic_catalog_sync_page_delay_seconds` to stay well below the upstream rate limit, and a new
+    pass starts `artic_catalog_sync_interval_seconds` after the previous one finished. Only new or changed places are
+    written, and a failed page is retried after the pass interval. Once every page of a pass is mirrored, places it did
+    not list are deleted. Only the worker process holding `artic_catalog_sync_lock_path` syncs; the others stand by.
+    """
+    lock = CatalogSyncLock(settings.artic_catalog_sync_lock_path)
+    page = 1
+    pass_started_at = datetime.datetime.now(datetime.UTC)
+    try:
+        while True:
+            if not lock.acquire():
+                await asyncio.sleep(LOCK_RETRY_SECONDS)
+                continue
+
+            delay = settings.artic_catalog_sync_interval_seconds
+            try:
+                async with AsyncSessionLocal() as session:
+                    service = CatalogSyncService(session)
+                    _, total_pages = await service.sync_page(page, pass_started_at=pass_started_at)
+                    if page >= total_pages:
+                        removed = await service.prune(pass_started_at)
+                        if removed:
+                            logger.info("Catalog sync removed %d places no longer listed upstream", removed)
+                    await session.commit()
+            except ArtInstituteClientError as exc:
+                logger.warning("Catalog sync of page %d failed: %s", page, exc)
+            except Exception:
+                # Database or payload errors must not end the task; retry the page on the next pass.
+                logger.exception("Catalog sync of page %d failed", page)
+            else:
+                if page < total_pages:
+                    page += 1
+                    delay = settings.artic_catalog_sync_page_delay_seconds
+                else:
+                    page = 1
+                    pass_started_at = datetime.datetime.now(datetime.UTC)
+            await asyncio.sleep(delay)
+    finally:
+        lock.release()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import math
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.artic.client import ArtInstituteClient
+from app.clients.artic.schemas import Pagination, PlaceSearchItem, PlacesSearchResponse
+from app.config import settings
+from app.repositories.catalog_place import CatalogPlaceRepository
+
+
+class PlaceSearchService:
+    """Place search for the external proxy, served by upstream or by the local catalog index."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.catalog_repo = CatalogPlaceRepository(db)
+        self.artic = ArtInstituteClient()
+
+    async def search(self, *, q: str, limit: int, page: int) -> PlacesSearchResponse:
+        if settings.artic_search_backend == "local":
+            return await self._search_local(q=q, limit=limit, page=page)
+        return await self.artic.search_places(q=q, limit=limit, page=page)
+
+    async def _search_local(self, *, q: str, limit: int, page: int) -> PlacesSearchResponse:
+        offset = (page - 1) * limit
+        matches, total = await self.catalog_repo.search(q, limit=limit, offset=offset)
+        return PlacesSearchResponse(
+            pagination=Pagination(
+                total=total,
+                limit=limit,
+                offset=offset,
+                total_pages=math.ceil(total / limit),
+                current_page=page,
+            ),
+            data=[
+                PlaceSearchItem.model_validate(
+                    {"id": place.external_id, "title": place.title, "api_link": place.api_link, "_score": score},
+                )
+                for place, score in matches
+            ],
+        )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+
+import jwt
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.revoked_token import RevokedTokenRepository
+from app.security import revocation_list
+
+
+class TokenRevocationService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.revoked_token_repo = RevokedTokenRepository(db)
+
+    async def revoke(self, token: str) -> None:
+        """Revoke a still-valid token; tokens that are already invalid or carry no `jti` need nothing."""
+        try:
+            payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+            jti: str = payload["jti"]
+            expires_at: float = payload["exp"]
+        except (jwt.InvalidTokenError, KeyError):
+            return
+
+        await self.revoked_token_repo.add(jti, datetime.datetime.fromtimestamp(expires_at, datetime.UTC))
+        # Effective at once in this worker; the others pick it up on their next refresh.
+        revocation_list.add(jti, expires_at)
+
+    async def refresh(self) -> int:
+        """Load revocations committed since the last refresh into this worker's revocation list."""
+        now = datetime.datetime.now(datetime.UTC)
+        rows = await self.revoked_token_repo.list_active_after(revocation_list.last_id, now)
+        for row_id, jti, expires_at in rows:
+            # SQLite hands back naive datetimes; they are stored in UTC.
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=datetime.UTC)
+            revocation_list.add(jti, expires_at.timestamp())
+            revocation_list.last_id = row_id
+        return len(rows)
+
+    async def purge_expired(self) -> int:
+        revocation_list.prune()
+        return await self.revoked_token_repo.delete_expired(datetime.datetime.now(datetime.UTC))
+
+
+async def run_revocation_sync_forever() -> None:
+    """Poll the revocation table so that a logout in any worker applies everywhere.
+
+    New revocations reach this worker within `jwt_revocation_refresh_seconds`. Expired ones are dropped from memory
+    and the table every `jwt_revocation_purge_interval_seconds`.
+    """
+    purged_at = time.monotonic()
+    while True:
+        await asyncio.sleep(settings.jwt_revocation_refresh_seconds)
+        try:
+            async with AsyncSessionLocal() as session:
+                service = TokenRevocationService(session)
+                await service.refresh()
+                if time.monotonic() - purged_at >= settings.jwt_revocation_purge_interval_seconds:
+                    await service.purge_expired()
+                    purged_at = time.monotonic()
+                await session.commit()
+        except SQLAlchemyError:
+            # Keep serving with the current list; the next poll catches up from `last_id`.
+            pass
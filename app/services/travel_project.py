@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.clients.artic.client import ArtInstituteClient
 from app.clients.artic.errors import (
@@ -14,9 +17,13 @@ from app.clients.artic.errors import (
     ArtInstituteRateLimitError,
     ArtInstituteTimeoutError,
 )
+from app.clients.artic.schemas import ArticPlace
+from app.config import settings
 from app.constants import MAX_PLACES_PER_PROJECT
 from app.models.project_place import ProjectPlace
 from app.models.travel_project import TravelProject
+from app.repositories.catalog_place import CatalogPlaceRepository
+from app.repositories.pagination import InvalidCursorError
 from app.repositories.project_place import ProjectPlaceRepository
 from app.repositories.travel_project import TravelProjectRepository
 from app.schemas.project_place import ProjectPlaceImport, ProjectPlaceUpdate
@@ -28,6 +35,7 @@ class TravelProjectService:
         self.db = db
         self.project_repo = TravelProjectRepository(db)
         self.place_repo = ProjectPlaceRepository(db)
+        self.catalog_repo = CatalogPlaceRepository(db)
         self.artic = ArtInstituteClient()
 
     async def list_projects(
@@ -35,17 +43,25 @@ class TravelProjectService:
         user_id: str,
         *,
         limit: int,
-        offset: int,
+        offset: int = 0,
+        cursor: str | None = None,
         is_completed: bool | None = None,
         q: str | None = None,
-    ) -> list[TravelProject]:
-        return await self.project_repo.list_for_user(
-            user_id,
-            limit=limit,
-            offset=offset,
-            is_completed=is_completed,
-            q=q,
-        )
+    ) -> tuple[list[TravelProject], str | None]:
+        if cursor is not None and q:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search results are paged by offset, not cursor",
+            )
+        with self._invalid_cursor_as_http(offset, cursor):
+            return await self.project_repo.list_for_user(
+                user_id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                is_completed=is_completed,
+                q=q,
+            )
 
     async def get_project(self, user_id: str, project_id: str) -> TravelProject:
         project = await self.project_repo.get_for_user_by_id(user_id, project_id)
@@ -53,7 +69,14 @@ class TravelProjectService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
         return project
 
+    async def get_project_with_places(self, user_id: str, project_id: str) -> TravelProject:
+        project = await self.project_repo.get_for_user_with_places(user_id, project_id)
+        if not project:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+        return project
+
     async def create_project(self, user_id: str, payload: TravelProjectCreate) -> TravelProject:
+        """Create the project and its places; the returned project has `places` populated."""
         external_ids = [p.external_id for p in payload.places]
         if len(set(external_ids)) != len(external_ids):
             raise HTTPException(
@@ -62,35 +85,37 @@ class TravelProjectService:
             )
 
         if len(external_ids) > MAX_PLACES_PER_PROJECT:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Maximum {MAX_PLACES_PER_PROJECT} places per project",
-            )
+            raise self._max_places_error()
+
+        places_from_api = await self._resolve_places(external_ids)
 
         project = TravelProject(
             user_id=UUID(user_id),
             name=payload.name,
             description=payload.description,
             start_date=payload.start_date,
+            places_count=len(places_from_api),
         )
         await self.project_repo.create(project)
 
-        for place_payload in payload.places:
-            place_from_api = await self._get_place_or_http_error(place_payload.external_id)
-            place = ProjectPlace(
+        places = [
+            ProjectPlace(
                 project_id=project.id,
                 external_id=place_from_api.id,
                 title=place_from_api.title,
                 notes=place_payload.notes,
             )
+            for place_payload, place_from_api in zip(payload.places, places_from_api, strict=True)
+        ]
+        if places:
             try:
-                await self.place_repo.create(place)
+                await self.place_repo.create_many(places)
             except IntegrityError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST, detail="Place already added to project"
                 ) from None
-
-        await self._sync_project_completion(str(project.id))
+        # Everything the response needs is already in memory (server defaults come back via RETURNING).
+        set_committed_value(project, "places", places)
         return project
 
     async def update_project(self, user_id: str, project_id: str, payload: TravelProjectUpdate) -> TravelProject:
@@ -102,7 +127,7 @@ class TravelProjectService:
 
     async def delete_project(self, user_id: str, project_id: str) -> None:
         project = await self.get_project(user_id, project_id)
-        if await self.place_repo.any_visited_for_project(project_id):
+        if project.visited_count > 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Project cannot be deleted because it has visited places",
@@ -115,11 +140,19 @@ class TravelProjectService:
         project_id: str,
         *,
         limit: int,
-        offset: int,
+        offset: int = 0,
+        cursor: str | None = None,
         visited: bool | None = None,
-    ) -> list[ProjectPlace]:
+    ) -> tuple[list[ProjectPlace], str | None]:
         await self.get_project(user_id, project_id)
-        return await self.place_repo.list_for_project(project_id, limit=limit, offset=offset, visited=visited)
+        with self._invalid_cursor_as_http(offset, cursor):
+            return await self.place_repo.list_for_project(
+                project_id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                visited=visited,
+            )
 
     async def get_place(self, user_id: str, project_id: str, place_id: str) -> ProjectPlace:
         await self.get_project(user_id, project_id)
@@ -131,17 +164,13 @@ class TravelProjectService:
     async def add_place(self, user_id: str, project_id: str, payload: ProjectPlaceImport) -> ProjectPlace:
         project = await self.get_project(user_id, project_id)
 
-        current_count = await self.place_repo.count_for_project(project_id)
-        if current_count >= MAX_PLACES_PER_PROJECT:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Maximum {MAX_PLACES_PER_PROJECT} places per project",
-            )
+        if project.places_count >= MAX_PLACES_PER_PROJECT:
+            raise self._max_places_error()
 
         if await self.place_repo.exists_external_in_project(project_id, payload.external_id):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Place already added to project")
 
-        place_from_api = await self._get_place_or_http_error(payload.external_id)
+        [place_from_api] = await self._resolve_places([payload.external_id])
         place = ProjectPlace(
             project_id=project.id,
             external_id=place_from_api.id,
@@ -149,54 +178,81 @@ class TravelProjectService:
             notes=payload.notes,
         )
         created = await self.place_repo.create(place)
-        await self._sync_project_completion(project_id)
+        # Re-checks the limit atomically: a concurrent add may have taken the last slot since the check above.
+        if not await self.project_repo.apply_place_counts(project, places_delta=1, max_places=MAX_PLACES_PER_PROJECT):
+            raise self._max_places_error()
         return created
 
     async def update_place(
         self, user_id: str, project_id: str, place_id: str, payload: ProjectPlaceUpdate
     ) -> ProjectPlace:
-        place = await self.get_place(user_id, project_id, place_id)
+        project = await self.get_project(user_id, project_id)
+        place = await self.place_repo.get_for_project_by_id(project_id, place_id)
+        if not place:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Place not found")
         data = payload.model_dump(exclude_unset=True)
         if not data:
             return place
 
-        if data.get("visited") is True and not place.visited:
-            place.mark_visited()
-            data.pop("visited", None)
-        elif data.get("visited") is False and place.visited:
-            place.mark_unvisited()
-            data.pop("visited", None)
+        # `visited` is flipped by a conditional UPDATE rather than from the loaded row, so that concurrent requests
+        # setting the same value move the counters only once.
+        visited = data.pop("visited", None)
+        if visited is not None and await self.place_repo.set_visited(place, visited):
+            await self.project_repo.apply_place_counts(project, visited_delta=1 if visited else -1)
+        return await self.place_repo.update(place, data)
 
-        updated = await self.place_repo.update(place, data)
-        await self._sync_project_completion(project_id)
-        return updated
+    @staticmethod
+    def _max_places_error() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Maximum {MAX_PLACES_PER_PROJECT} places per project",
+        )
 
-    async def _sync_project_completion(self, project_id: str) -> None:
-        project = await self.project_repo.get_by_id(project_id)
-        if not project:
-            return
+    async def _resolve_places(self, external_ids: list[int]) -> list[ArticPlace]:
+        places: dict[int, ArticPlace | None] = {}
+        if settings.artic_catalog_sync_enabled:
+            mirrored = await self.catalog_repo.get_many(external_ids)
+            places.update(
+                {
+                    external_id: ArticPlace(id=row.external_id, title=row.title, api_link=row.api_link)
+                    for external_id, row in mirrored.items()
+                },
+            )
 
-        total = await self.place_repo.count_for_project(project_id)
-        visited = await self.place_repo.count_visited_for_project(project_id)
+        unknown = [external_id for external_id in external_ids if external_id not in places]
+        if unknown:
+            with self._artic_errors_as_http():
+                places.update(await self.artic.get_places(unknown))
 
-        if total > 0 and visited == total and not project.is_completed:
-            project.mark_completed()
-            await self.project_repo.update(
-                project,
-                {"is_completed": project.is_completed, "completed_at": project.completed_at},
-            )
-            return
+        resolved = []
+        for external_id in external_ids:
+            place = places.get(external_id)
+            if place is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Place not found in Art Institute API",
+                )
+            resolved.append(place)
+        return resolved
 
-        if project.is_completed:
-            project.mark_incomplete()
-            await self.project_repo.update(
-                project,
-                {"is_completed": project.is_completed, "completed_at": project.completed_at},
+    @staticmethod
+    @contextmanager
+    def _invalid_cursor_as_http(offset: int, cursor: str | None) -> Iterator[None]:
+        if cursor is not None and offset:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either cursor or offset, not both",
             )
+        try:
+            yield
+        except InvalidCursorError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
 
-    async def _get_place_or_http_error(self, external_id: int):
+    @staticmethod
+    @contextmanager
+    def _artic_errors_as_http() -> Iterator[None]:
         try:
-            return await self.artic.get_place(external_id)
+            yield
         except ArtInstituteNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.repositories.user import UserRepository
-from app.security import hash_password, verify_password
+from app.security import PasswordHashingBusyError, hash_password, password_needs_rehash, verify_password
 
 
 class UserService:
@@ -22,13 +22,22 @@ class UserService:
         if existing:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User already exists")
 
-        new_user = User(email=str(email), name=name, password_hash=hash_password(password))
+        new_user = User(email=str(email), name=name, password_hash=await hash_password(password))
         return await self.user_repo.create(new_user)
 
     async def authenticate(self, email: EmailStr, password: str) -> User:
         user = await self.user_repo.get_by_email(str(email))
-        if not user or not verify_password(user.password_hash, password):
+        if not user or not await verify_password(user.password_hash, password):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
+
+        # Roll out Argon2 parameter changes without a migration: upgrade the hash while we know the password. Best
+        # effort: when the hashing pool is saturated, the login still succeeds and a later one upgrades the hash.
+        if password_needs_rehash(user.password_hash):
+            try:
+                password_hash = await hash_password(password)
+            except PasswordHashingBusyError:
+                return user
+            user = await self.user_repo.update(user, {"password_hash": password_hash})
         return user
 
     async def update_name(self, user_id: str, name: str) -> User:
@@ -37,8 +46,8 @@ class UserService:
 
     async def update_password(self, user_id: str, current_password: str, new_password: str) -> None:
         user = await self.get_by_id(user_id)
-        if not verify_password(user.password_hash, current_password):
+        if not await verify_password(user.password_hash, current_password):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Current password is incorrect")
         if current_password == new_password:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="New password must be different")
-        await self.user_repo.update(user, {"password_hash": hash_password(new_password)})
+        await self.user_repo.update(user, {"password_hash": await hash_password(new_password)})
@@ -0,0 +1,47 @@
+"""Micro-benchmark: per-insert cost of the Art Institute place cache as it grows.
+
+Run with `python -m benchmarks.artic_cache`. Insert cost should stay flat across cache sizes.
+"""
+
+import time
+
+from app.cache import TTLCache
+from app.clients.artic.schemas import ArticPlace
+
+
+SIZES = (1_000, 10_000, 100_000)
+MEASURED_INSERTS = 10_000
+
+
+def bench_insert(size: int) -> float:
+    cache: TTLCache[int, ArticPlace] = TTLCache(max_entries=size)
+    place = ArticPlace(id=0, title="Benchmark place")
+    for key in range(size):
+        cache.set(key, place, ttl_seconds=300)
+
+    started = time.perf_counter()
+    for key in range(size, size + MEASURED_INSERTS):
+        cache.set(key, place, ttl_seconds=300)
+    return (time.perf_counter() - started) / MEASURED_INSERTS
+
+
+def bench_lookup(size: int) -> float:
+    cache: TTLCache[int, ArticPlace] = TTLCache(max_entries=size)
+    place = ArticPlace(id=0, title="Benchmark place")
+    for key in range(size):
+        cache.set(key, place, ttl_seconds=300)
+
+    started = time.perf_counter()
+    for key in range(MEASURED_INSERTS):
+        cache.get(key % size)
+    return (time.perf_counter() - started) / MEASURED_INSERTS
+
+
+def main() -> None:
+    print(f"{'entries':>10} {'insert (us)':>12} {'lookup (us)':>12}")
+    for size in SIZES:
+        print(f"{size:>10} {bench_insert(size) * 1e6:>12.2f} {bench_lookup(size) * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Per-page cost of offset vs. cursor (keyset) pagination of a user's projects.
+
+Run with `python -m benchmarks.pagination`. Uses a throwaway SQLite database. Offset pages get slower the deeper they
+are, because every skipped row is still read; cursor pages should cost the same at any depth.
+"""
+
+import asyncio
+import datetime
+import os
+import tempfile
+import time
+from uuid import uuid4
+
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp}/benchmark.db"
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.models.travel_project import TravelProject  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.travel_project import TravelProjectRepository  # noqa: E402
+
+
+PROJECTS = 100_000
+PAGE_SIZE = 20
+DEPTHS = (1, 100, 1_000, 4_000)
+REPEATS = 20
+
+
+async def seed() -> str:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id = uuid4()
+    started_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(User).values(id=user_id, email="bench@example.com", password_hash="x"))
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_id,
+                "name": f"Project {i}",
+                "created_at": started_at + datetime.timedelta(minutes=i),
+            }
+            for i in range(PROJECTS)
+        ]
+        await session.execute(insert(TravelProject), rows)
+        await session.commit()
+    return str(user_id)
+
+
+async def time_page(user_id: str, **page: object) -> float:
+    async with AsyncSessionLocal() as session:
+        repo = TravelProjectRepository(session)
+        started = time.perf_counter()
+        for _ in range(REPEATS):
+            await repo.list_for_user(user_id, limit=PAGE_SIZE, **page)
+        return (time.perf_counter() - started) / REPEATS
+
+
+async def run() -> list[tuple[int, float, float]]:
+    user_id = await seed()
+    results = []
+    for depth in DEPTHS:
+        offset = (depth - 1) * PAGE_SIZE
+        # The cursor of page N is returned alongside page N - 1.
+        async with AsyncSessionLocal() as session:
+            _, cursor = await TravelProjectRepository(session).list_for_user(
+                user_id,
+                limit=PAGE_SIZE,
+                offset=max(0, offset - PAGE_SIZE),
+            )
+        cursor_page = {"cursor": cursor} if depth > 1 else {}
+        results.append((depth, await time_page(user_id, offset=offset), await time_page(user_id, **cursor_page)))
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    print(f"{PROJECTS} projects, {PAGE_SIZE} per page")
+    print(f"{'page':>6} {'offset (ms)':>12} {'cursor (ms)':>12}")
+    for depth, offset_seconds, cursor_seconds in asyncio.run(run()):
+        print(f"{depth:>6} {offset_seconds * 1e3:>12.2f} {cursor_seconds * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
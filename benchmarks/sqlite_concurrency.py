@@ -0,0 +1,103 @@
+"""Concurrent write/read throughput of SQLite with its defaults vs. the app's connect-time PRAGMA profile.
+
+Run with `python -m benchmarks.sqlite_concurrency`. Each profile gets a fresh database file. Writer tasks insert
+projects, one committed transaction each, while reader tasks list the newest page of projects.
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base, apply_sqlite_pragmas
+from app.models.travel_project import TravelProject
+from app.models.user import User
+from app.repositories.travel_project import TravelProjectRepository
+
+
+WRITERS = 4
+READERS = 8
+DURATION_SECONDS = 5.0
+SEED_PROJECTS = 5_000
+
+
+async def seed(engine: AsyncEngine) -> str:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        user_id = uuid4()
+        await conn.execute(insert(User).values(id=user_id, email="bench@example.com", password_hash="x"))
+        await conn.execute(
+            insert(TravelProject),
+            [{"id": uuid4(), "user_id": user_id, "name": f"Project {i}"} for i in range(SEED_PROJECTS)],
+        )
+    return str(user_id)
+
+
+async def writer(sessions: async_sessionmaker[AsyncSession], user_id: str, deadline: float, stats: dict) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with sessions() as session:
+                session.add(TravelProject(user_id=UUID(user_id), name="Written"))
+                await session.commit()
+        except OperationalError:
+            stats["errors"] += 1
+            continue
+        stats["write_latencies"].append(time.perf_counter() - started)
+
+
+async def reader(sessions: async_sessionmaker[AsyncSession], user_id: str, deadline: float, stats: dict) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with sessions() as session:
+                await TravelProjectRepository(session).list_for_user(user_id, limit=20)
+        except OperationalError:
+            stats["errors"] += 1
+            continue
+        stats["read_latencies"].append(time.perf_counter() - started)
+
+
+async def run_profile(*, tuned: bool) -> dict:
+    path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=WRITERS + READERS)
+    if tuned:
+        event.listen(engine.sync_engine, "connect", apply_sqlite_pragmas)
+    user_id = await seed(engine)
+    sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    stats: dict = {"errors": 0, "write_latencies": [], "read_latencies": []}
+    deadline = time.perf_counter() + DURATION_SECONDS
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(WRITERS):
+            tg.create_task(writer(sessions, user_id, deadline, stats))
+        for _ in range(READERS):
+            tg.create_task(reader(sessions, user_id, deadline, stats))
+    await engine.dispose()
+    return stats
+
+
+def p99_ms(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=100)[98] * 1e3 if len(latencies) > 1 else 0.0
+
+
+def main() -> None:
+    print(f"{WRITERS} writers, {READERS} readers, {DURATION_SECONDS:.0f}s per profile")
+    print(f"{'profile':<16} {'writes/s':>9} {'reads/s':>9} {'write p99 ms':>13} {'read p99 ms':>12} {'errors':>7}")
+    for label, tuned in (("sqlite defaults", False), ("app profile", True)):
+        stats = asyncio.run(run_profile(tuned=tuned))
+        writes, reads = stats["write_latencies"], stats["read_latencies"]
+        print(
+            f"{label:<16} {len(writes) / DURATION_SECONDS:>9.0f} {len(reads) / DURATION_SECONDS:>9.0f} "
+            f"{p99_ms(writes):>13.1f} {p99_ms(reads):>12.1f} {stats['errors']:>7}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""SQL statements issued per API endpoint.
+
+Run with `python -m benchmarks.statement_counts`. Uses a throwaway SQLite database and resolves places from the local
+catalog mirror, so no upstream calls are made.
+"""
+
+import asyncio
+import datetime
+import os
+import tempfile
+
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp}/benchmark.db"
+os.environ["ARTIC_CATALOG_SYNC_ENABLED"] = "true"
+
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.repositories.catalog_place import CatalogPlaceRepository  # noqa: E402
+from main import app  # noqa: E402
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *_: object) -> None:
+        self.count += 1
+
+
+async def run() -> list[tuple[str, int]]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as session:
+        rows = [{"external_id": i, "title": f"Place {i}", "api_link": None} for i in range(1, 11)]
+        await CatalogPlaceRepository(session).upsert_many(rows, seen_at=datetime.datetime.now(datetime.UTC))
+        await session.commit()
+
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    results: list[tuple[str, int]] = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test/api/v1") as client:
+
+        async def call(label: str, method: str, url: str, **kwargs: object) -> httpx.Response:
+            counter.count = 0
+            response = await client.request(method, url, **kwargs)
+            response.raise_for_status()
+            results.append((label, counter.count))
+            return response
+
+        credentials = {"email": "bench@example.com", "password": "password1"}
+        await call("POST /auth/register", "POST", "/auth/register", json={**credentials, "name": "Bench"})
+        login = await call("POST /auth/login", "POST", "/auth/login", json=credentials)
+        client.cookies = login.cookies
+        await call("GET /users/me", "GET", "/users/me")
+        await call("PATCH /users/me", "PATCH", "/users/me", json={"name": "Bench 2"})
+
+        project = await call(
+            "POST /projects (3 places)",
+            "POST",
+            "/projects",
+            json={"name": "Trip", "places": [{"external_id": i} for i in (1, 2, 3)]},
+        )
+        project_id = project.json()["id"]
+        await call("GET /projects", "GET", "/projects")
+        await call("GET /projects/{id}", "GET", f"/projects/{project_id}")
+        await call("PATCH /projects/{id}", "PATCH", f"/projects/{project_id}", json={"name": "Trip 2"})
+
+        places_url = f"/projects/{project_id}/places"
+        place = await call("POST /projects/{id}/places", "POST", places_url, json={"external_id": 4})
+        place_url = f"{places_url}/{place.json()['id']}"
+        await call("GET /projects/{id}/places", "GET", places_url)
+        await call("PATCH .../places/{id} (visited)", "PATCH", place_url, json={"visited": True})
+        await call("PATCH .../places/{id} (notes)", "PATCH", place_url, json={"notes": "Museum"})
+
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    print(f"{'endpoint':<36} {'statements':>10}")
+    for label, count in asyncio.run(run()):
+        print(f"{label:<36} {count:>10}")
+
+
+if __name__ == "__main__":
+    main()
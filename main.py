@@ -1,20 +1,39 @@
+import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.clients.artic.client import ArtInstituteClient
 from app.config import settings
-from app.database import Base, engine
+from app.constants import NEXT_CURSOR_HEADER
+from app.database import AsyncSessionLocal, Base, engine
 from app.routers.base import base_api_router
+from app.services.catalog_sync import run_catalog_sync_forever
+from app.services.token_revocation import TokenRevocationService, run_revocation_sync_forever
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as session:
+        await TokenRevocationService(session).refresh()
+
+    if settings.artic_warmup_enabled:
+        await ArtInstituteClient.warm_up()
+
+    catalog_sync = asyncio.create_task(run_catalog_sync_forever()) if settings.artic_catalog_sync_enabled else None
+    revocation_sync = asyncio.create_task(run_revocation_sync_forever())
     yield
+    revocation_sync.cancel()
+    with suppress(asyncio.CancelledError):
+        await revocation_sync
+    if catalog_sync is not None:
+        catalog_sync.cancel()
+        with suppress(asyncio.CancelledError):
+            await catalog_sync
     await ArtInstituteClient.aclose_shared()
 
 
@@ -31,6 +50,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=settings.allowed_methods,
     allow_headers=settings.allowed_headers,
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(base_api_router)
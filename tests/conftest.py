@@ -0,0 +1,108 @@
+import os
+import tempfile
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+
+# Settings are read at import time: point the app's global engine at a throwaway database before importing it.
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/app.db"
+os.environ["ARTIC_DISK_CACHE_ENABLED"] = "false"
+os.environ["ARTIC_CATALOG_SYNC_ENABLED"] = "false"
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.cache import TTLCache
+from app.clients.artic.circuit_breaker import CircuitBreaker
+from app.clients.artic.client import ArtInstituteClient
+from app.clients.artic.rate_limit import TokenBucket
+from app.clients.artic.singleflight import SingleFlight
+from app.database import Base, apply_sqlite_pragmas
+from app.models import CatalogPlace, ProjectPlace, RevokedToken, TravelProject, User  # noqa: F401
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeUpstream:
+    """Stands in for the Art Institute API: known place IDs map to titles, any other ID answers 404.
+
+    Set `status_code` to make every request fail with that status instead.
+    """
+
+    def __init__(self) -> None:
+        self.titles: dict[int, str] = {}
+        self.requests: list[httpx.Request] = []
+        self.status_code: int | None = None
+
+    def client(self) -> ArtInstituteClient:
+        transport = httpx.MockTransport(self._handle)
+        return ArtInstituteClient(http_client=httpx.AsyncClient(transport=transport, base_url="https://artic.test"))
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.status_code is not None:
+            return httpx.Response(self.status_code)
+        if request.url.path == "/places":
+            ids = [int(external_id) for external_id in request.url.params["ids"].split(",")]
+            return httpx.Response(200, json={"data": [self._place(i) for i in ids if i in self.titles]})
+
+        external_id = int(request.url.path.rsplit("/", 1)[1])
+        if external_id not in self.titles:
+            return httpx.Response(404, json={"detail": "Not found"})
+        return httpx.Response(200, json={"data": self._place(external_id)})
+
+    def _place(self, external_id: int) -> dict[str, int | str]:
+        return {"id": external_id, "title": self.titles[external_id], "api_link": f"/places/{external_id}"}
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_session(tmp_path: Path) -> AsyncIterator[AsyncSession]:
+    """A session on a fresh SQLite database created from the models, with the app's connection PRAGMAs."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/test.db")
+    event.listen(engine.sync_engine, "connect", apply_sqlite_pragmas)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeClock]:
+    """Reset the Artic client's process-wide state; its caches run on the returned fake clock."""
+    clock = FakeClock()
+    for name in ("_cache", "_not_found_cache"):
+        monkeypatch.setattr(ArtInstituteClient, name, TTLCache(max_entries=100, clock=clock))
+    monkeypatch.setattr(ArtInstituteClient, "_response_cache", TTLCache(max_entries=100, clock=clock))
+    monkeypatch.setattr(ArtInstituteClient, "_singleflight", SingleFlight())
+    monkeypatch.setattr(
+        ArtInstituteClient,
+        "_circuit_breaker",
+        CircuitBreaker(failure_rate_threshold=0.5, window_size=20, min_calls=5, open_seconds=30.0),
+    )
+    monkeypatch.setattr(ArtInstituteClient, "_rate_limiter", TokenBucket(rate=0, burst=1, max_wait_seconds=0))
+    monkeypatch.setattr(ArtInstituteClient, "_background_tasks", set())
+    monkeypatch.setattr(ArtInstituteClient, "_disk_cache", None)
+    yield clock
+
+
+@pytest.fixture
+def upstream(clock: FakeClock) -> FakeUpstream:
+    return FakeUpstream()
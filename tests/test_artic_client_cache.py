@@ -0,0 +1,143 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.clients.artic.client import ArtInstituteClient
+from app.clients.artic.errors import ArtInstituteNotFoundError
+from app.config import settings
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def cache_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "artic_cache_enabled", True)
+    monkeypatch.setattr(settings, "artic_cache_ttl_seconds", 300)
+    monkeypatch.setattr(settings, "artic_cache_stale_seconds", 60)
+    monkeypatch.setattr(settings, "artic_negative_cache_ttl_seconds", 30)
+
+
+async def drain_background_tasks() -> None:
+    await asyncio.gather(*ArtInstituteClient._background_tasks)
+
+
+async def test_fresh_place_is_served_from_cache(clock, upstream) -> None:
+    upstream.titles[1] = "Paris"
+    client = upstream.client()
+
+    assert (await client.get_place(1)).title == "Paris"
+    clock.advance(299)
+    assert (await client.get_place(1)).title == "Paris"
+
+    assert len(upstream.requests) == 1
+
+
+async def test_stale_place_is_served_then_refreshed_in_background(clock, upstream) -> None:
+    upstream.titles[1] = "Paris"
+    client = upstream.client()
+    await client.get_place(1)
+
+    upstream.titles[1] = "Paris, France"
+    clock.advance(310)
+    # Stale: answered from the cache at once, refreshed behind the caller's back.
+    assert (await client.get_place(1)).title == "Paris"
+    await drain_background_tasks()
+
+    assert len(upstream.requests) == 2
+    assert (await client.get_place(1)).title == "Paris, France"
+    assert len(upstream.requests) == 2
+
+
+async def test_failed_revalidation_keeps_serving_stale_place(clock, upstream, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "artic_retry_max_attempts", 1)
+    upstream.titles[1] = "Paris"
+    client = upstream.client()
+    await client.get_place(1)
+
+    upstream.status_code = 503
+    clock.advance(310)
+    assert (await client.get_place(1)).title == "Paris"
+    await drain_background_tasks()
+
+    assert len(upstream.requests) == 2
+    assert (await client.get_place(1)).title == "Paris"
+    await drain_background_tasks()
+
+
+async def test_revalidation_404_replaces_stale_place(clock, upstream) -> None:
+    upstream.titles[1] = "Paris"
+    client = upstream.client()
+    await client.get_place(1)
+
+    del upstream.titles[1]
+    clock.advance(310)
+    assert (await client.get_place(1)).title == "Paris"
+    await drain_background_tasks()
+
+    with pytest.raises(ArtInstituteNotFoundError):
+        await client.get_place(1)
+    assert len(upstream.requests) == 2
+
+
+async def test_place_past_stale_window_is_fetched_synchronously(clock, upstream) -> None:
+    upstream.titles[1] = "Paris"
+    client = upstream.client()
+    await client.get_place(1)
+
+    upstream.titles[1] = "Paris, France"
+    clock.advance(361)
+    assert (await client.get_place(1)).title == "Paris, France"
+    assert ArtInstituteClient._background_tasks == set()
+    assert len(upstream.requests) == 2
+
+
+async def test_not_found_is_cached_until_negative_ttl(clock, upstream) -> None:
+    client = upstream.client()
+
+    for _ in range(2):
+        with pytest.raises(ArtInstituteNotFoundError):
+            await client.get_place(404)
+    assert len(upstream.requests) == 1
+
+    upstream.titles[404] = "Found later"
+    clock.advance(31)
+    assert (await client.get_place(404)).title == "Found later"
+    assert len(upstream.requests) == 2
+
+
+async def test_batched_lookup_caches_hits_and_misses(clock, upstream) -> None:
+    upstream.titles[1] = "Paris"
+    client = upstream.client()
+
+    assert await client.get_places([1, 2]) == {1: await client.get_place(1), 2: None}
+    assert await client.get_places([2, 1]) == {2: None, 1: await client.get_place(1)}
+
+    assert len(upstream.requests) == 1
+
+
+@pytest.fixture
+async def disk_cache(monkeypatch, tmp_path) -> AsyncIterator[None]:
+    monkeypatch.setattr(settings, "artic_disk_cache_enabled", True)
+    monkeypatch.setattr(settings, "artic_disk_cache_path", str(tmp_path / "artic_cache.db"))
+    yield
+    if ArtInstituteClient._disk_cache is not None:
+        await ArtInstituteClient._disk_cache.close()
+
+
+async def test_not_found_also_drops_the_disk_copy(clock, upstream, disk_cache) -> None:
+    upstream.titles[1] = "Paris"
+    client = upstream.client()
+    await client.get_place(1)
+
+    del upstream.titles[1]
+    clock.advance(310)
+    await client.get_place(1)
+    await drain_background_tasks()
+
+    # Once the negative entry expires, the place must not come back from the disk tier.
+    clock.advance(31)
+    with pytest.raises(ArtInstituteNotFoundError):
+        await client.get_place(1)
+    assert len(upstream.requests) == 3
@@ -0,0 +1,36 @@
+import datetime
+
+import pytest
+
+from app.repositories.catalog_place import CatalogPlaceRepository
+
+
+pytestmark = pytest.mark.anyio
+
+FIRST_PASS = datetime.datetime(2026, 1, 1, 12, 0, tzinfo=datetime.UTC)
+SECOND_PASS = FIRST_PASS + datetime.timedelta(hours=1)
+
+
+def place(external_id: int, title: str) -> dict:
+    return {"external_id": external_id, "title": title, "api_link": f"/places/{external_id}"}
+
+
+async def test_full_pass_prunes_places_removed_upstream(db_session) -> None:
+    repo = CatalogPlaceRepository(db_session)
+    assert await repo.upsert_many([place(1, "Paris"), place(2, "Rome"), place(3, "Oslo")], seen_at=FIRST_PASS) == 3
+    await db_session.commit()
+    synced_at = (await repo.get_many([1]))[1].synced_at
+
+    # The second pass lists place 1 unchanged and place 2 renamed, over two pages; place 3 is gone upstream.
+    assert await repo.upsert_many([place(1, "Paris")], seen_at=SECOND_PASS) == 0
+    assert await repo.upsert_many([place(2, "Roma")], seen_at=SECOND_PASS) == 1
+    assert await repo.delete_not_seen_since(SECOND_PASS) == 1
+    await db_session.commit()
+    db_session.expunge_all()
+
+    places = await repo.get_many([1, 2, 3])
+    assert {external_id: row.title for external_id, row in places.items()} == {1: "Paris", 2: "Roma"}
+    assert places[1].synced_at == synced_at
+    assert await repo.search("oslo", limit=10, offset=0) == ([], 0)
+    [(match, _)], total = await repo.search("roma", limit=10, offset=0)
+    assert (match.external_id, total) == (2, 1)
@@ -0,0 +1,107 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import String, type_coerce, update
+
+from app.models.project_place import ProjectPlace
+from app.models.travel_project import TravelProject
+from app.models.user import User
+from app.repositories.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.repositories.project_place import ProjectPlaceRepository
+from app.repositories.travel_project import TravelProjectRepository
+
+
+pytestmark = pytest.mark.anyio
+
+# Stored the way SQLite's CURRENT_TIMESTAMP server default writes it: rows created in the same second tie.
+SAME_SECOND = "2026-01-01 12:00:00"
+
+
+@pytest.fixture
+async def user(db_session) -> User:
+    user = User(email="pages@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def set_created_at(db_session, model, rows, created_at: str) -> None:
+    # Written as raw text, like the server default, rather than through the DateTime type.
+    stmt = update(model).where(model.id.in_([row.id for row in rows]))
+    await db_session.execute(stmt.values(created_at=type_coerce(created_at, String)))
+    await db_session.commit()
+    db_session.expunge_all()
+
+
+async def collect_pages(list_page, *, limit: int) -> list:
+    items, cursor = await list_page(limit=limit)
+    pages = [items]
+    while cursor is not None:
+        items, cursor = await list_page(limit=limit, cursor=cursor)
+        pages.append(items)
+    assert all(len(page) == limit for page in pages[:-1])
+    return [item.id for page in pages for item in page]
+
+
+def test_cursor_round_trip() -> None:
+    row_id = uuid4()
+    assert decode_cursor(encode_cursor(SAME_SECOND, row_id)) == (SAME_SECOND, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor(SAME_SECOND, uuid4())[:-4], "WzEsMl0"])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7, 20])
+async def test_project_cursor_pages_cover_rows_with_identical_created_at(db_session, user, limit) -> None:
+    repo = TravelProjectRepository(db_session)
+    projects = [await repo.create(TravelProject(user_id=user.id, name=f"Trip {i}")) for i in range(7)]
+    await set_created_at(db_session, TravelProject, projects[:5], SAME_SECOND)
+    await set_created_at(db_session, TravelProject, projects[5:6], "2026-01-01 11:59:59")
+    await set_created_at(db_session, TravelProject, projects[6:], "2026-01-01 12:00:01")
+
+    def list_page(**kwargs):
+        return repo.list_for_user(str(user.id), **kwargs)
+
+    # Newest first, ties broken by id, and no row skipped or repeated at a page boundary.
+    tied = sorted((project.id for project in projects[:5]), key=lambda project_id: project_id.hex, reverse=True)
+    expected = [projects[6].id, *tied, projects[5].id]
+    assert await collect_pages(list_page, limit=limit) == expected
+    offset_page, _ = await repo.list_for_user(str(user.id), limit=20)
+    assert [project.id for project in offset_page] == expected
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4])
+async def test_place_cursor_pages_cover_rows_with_identical_created_at(db_session, user, limit) -> None:
+    project = await TravelProjectRepository(db_session).create(TravelProject(user_id=user.id, name="Trip"))
+    repo = ProjectPlaceRepository(db_session)
+    places = await repo.create_many(
+        [ProjectPlace(project_id=project.id, external_id=i, visited=i % 2 == 0) for i in range(6)],
+    )
+    await set_created_at(db_session, ProjectPlace, places, SAME_SECOND)
+
+    def list_page(**kwargs):
+        return repo.list_for_project(str(project.id), **kwargs)
+
+    def list_visited_page(**kwargs):
+        return repo.list_for_project(str(project.id), visited=True, **kwargs)
+
+    # Oldest first: with identical timestamps, ascending by id.
+    expected = sorted((place.id for place in places), key=lambda place_id: place_id.hex)
+    assert await collect_pages(list_page, limit=limit) == expected
+    visited = {place.id for place in places if place.visited}
+    assert await collect_pages(list_visited_page, limit=limit) == [i for i in expected if i in visited]
+
+
+async def test_last_full_page_has_no_next_cursor(db_session, user) -> None:
+    repo = TravelProjectRepository(db_session)
+    for i in range(4):
+        await repo.create(TravelProject(user_id=user.id, name=f"Trip {i}"))
+
+    first, cursor = await repo.list_for_user(str(user.id), limit=2)
+    second, next_cursor = await repo.list_for_user(str(user.id), limit=2, cursor=cursor)
+
+    assert len(first) == len(second) == 2
+    assert next_cursor is None
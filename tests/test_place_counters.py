@@ -0,0 +1,166 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.constants import MAX_PLACES_PER_PROJECT
+from app.models.project_place import ProjectPlace
+from app.models.travel_project import TravelProject
+from app.models.user import User
+from app.schemas.project_place import ProjectPlaceImport, ProjectPlaceUpdate
+from app.schemas.travel_project import TravelProjectCreate
+from app.services.travel_project import TravelProjectService
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def service(db_session, upstream) -> TravelProjectService:
+    upstream.titles.update({external_id: f"Place {external_id}" for external_id in range(1, 20)})
+    service = TravelProjectService(db_session)
+    service.artic = upstream.client()
+    return service
+
+
+@pytest.fixture
+async def user_id(db_session) -> str:
+    user = User(email="counters@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.flush()
+    return str(user.id)
+
+
+async def create_project(service: TravelProjectService, user_id: str, *external_ids: int) -> TravelProject:
+    payload = TravelProjectCreate(name="Trip", places=[ProjectPlaceImport(external_id=i) for i in external_ids])
+    return await service.create_project(user_id, payload)
+
+
+async def set_visited(service: TravelProjectService, user_id: str, place: ProjectPlace, visited: bool) -> None:
+    await service.update_place(user_id, str(place.project_id), str(place.id), ProjectPlaceUpdate(visited=visited))
+
+
+async def reload(service: TravelProjectService, user_id: str, project: TravelProject) -> TravelProject:
+    """Read the project back from the database, bypassing the identity map."""
+    service.db.expunge(project)
+    return await service.get_project(user_id, str(project.id))
+
+
+async def assert_counters_match_rows(service: TravelProjectService, project: TravelProject) -> None:
+    places_count, visited_count = (
+        await service.db.execute(
+            select(func.count(), func.count().filter(ProjectPlace.visited)).where(
+                ProjectPlace.project_id == project.id,
+            ),
+        )
+    ).one()
+    assert (project.places_count, project.visited_count) == (places_count, visited_count)
+
+
+async def test_counters_follow_added_places(service, user_id) -> None:
+    project = await create_project(service, user_id, 1, 2)
+    assert (project.places_count, project.visited_count, project.is_completed) == (2, 0, False)
+
+    await service.add_place(user_id, str(project.id), ProjectPlaceImport(external_id=3))
+
+    project = await reload(service, user_id, project)
+    assert (project.places_count, project.visited_count) == (3, 0)
+    await assert_counters_match_rows(service, project)
+
+
+async def test_visiting_every_place_completes_the_project(service, user_id) -> None:
+    project = await create_project(service, user_id, 1, 2)
+    first, second = project.places
+
+    await set_visited(service, user_id, first, True)
+    # Visiting an already visited place changes nothing.
+    await set_visited(service, user_id, first, True)
+    assert (project.visited_count, project.is_completed) == (1, False)
+
+    await set_visited(service, user_id, second, True)
+    assert (project.visited_count, project.is_completed) == (2, True)
+    assert project.completed_at is not None
+
+    project = await reload(service, user_id, project)
+    assert (project.places_count, project.visited_count, project.is_completed) == (2, 2, True)
+    await assert_counters_match_rows(service, project)
+
+
+async def test_unvisiting_or_adding_a_place_reopens_the_project(service, user_id) -> None:
+    project = await create_project(service, user_id, 1)
+    [place] = project.places
+    await set_visited(service, user_id, place, True)
+    completed_at = project.completed_at
+
+    # Editing a place without touching `visited` keeps the project completed, with its original timestamp.
+    await service.update_place(user_id, str(project.id), str(place.id), ProjectPlaceUpdate(notes="Again"))
+    project = await reload(service, user_id, project)
+    assert (project.is_completed, project.completed_at) == (True, completed_at)
+
+    await set_visited(service, user_id, place, False)
+    assert (project.visited_count, project.is_completed, project.completed_at) == (0, False, None)
+
+    await set_visited(service, user_id, place, True)
+    await service.add_place(user_id, str(project.id), ProjectPlaceImport(external_id=2))
+    project = await reload(service, user_id, project)
+    assert (project.places_count, project.visited_count, project.is_completed) == (2, 1, False)
+    await assert_counters_match_rows(service, project)
+
+
+async def test_concurrent_visits_of_the_same_place_count_once(service, user_id, db_session) -> None:
+    project = await create_project(service, user_id, 1, 2)
+    first, _ = project.places
+    await db_session.commit()
+
+    # A second request, on its own connection, loads the place before the first one marks it visited.
+    async with async_sessionmaker(bind=db_session.bind, expire_on_commit=False)() as other_session:
+        other = TravelProjectService(other_session)
+        other.artic = service.artic
+        stale = await other.place_repo.get_for_project_by_id(str(project.id), str(first.id))
+        assert not stale.visited
+
+        await set_visited(service, user_id, first, True)
+        await db_session.commit()
+        await set_visited(other, user_id, stale, True)
+        await other_session.commit()
+        assert stale.visited
+
+    project = await reload(service, user_id, project)
+    assert (project.places_count, project.visited_count, project.is_completed) == (2, 1, False)
+    await assert_counters_match_rows(service, project)
+
+
+async def test_deleting_the_last_unvisited_place_completes_the_project(service, user_id) -> None:
+    project = await create_project(service, user_id, 1, 2)
+    first, second = project.places
+    await set_visited(service, user_id, first, True)
+
+    await service.place_repo.delete(second)
+    await service.db.flush()
+    assert await service.project_repo.apply_place_counts(project, places_delta=-1)
+    assert (project.places_count, project.visited_count, project.is_completed) == (1, 1, True)
+
+    await service.place_repo.delete(first)
+    await service.db.flush()
+    assert await service.project_repo.apply_place_counts(project, places_delta=-1, visited_delta=-1)
+    assert (project.places_count, project.visited_count, project.is_completed) == (0, 0, False)
+
+    project = await reload(service, user_id, project)
+    await assert_counters_match_rows(service, project)
+
+
+async def test_place_limit_is_enforced_by_the_counter(service, user_id) -> None:
+    project = await create_project(service, user_id, *range(1, MAX_PLACES_PER_PROJECT + 1))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.add_place(user_id, str(project.id), ProjectPlaceImport(external_id=MAX_PLACES_PER_PROJECT + 1))
+    assert exc_info.value.status_code == 400
+
+    assert not await service.project_repo.apply_place_counts(
+        project,
+        places_delta=1,
+        max_places=MAX_PLACES_PER_PROJECT,
+    )
+    project = await reload(service, user_id, project)
+    assert project.places_count == MAX_PLACES_PER_PROJECT
+    await assert_counters_match_rows(service, project)
@@ -0,0 +1,126 @@
+"""Query-plan regression test: every repository query must be served by an index.
+
+Builds the schema with the Alembic migrations, calls every repository method while recording the SQL it issues, and
+runs `EXPLAIN QUERY PLAN` on each SELECT, UPDATE and DELETE. A plan with a full table or index scan (`SCAN ...`, FTS5
+virtual tables excepted) or a temporary B-tree for sorting or grouping fails the test.
+"""
+
+import datetime
+import re
+from uuid import uuid4
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import event
+
+from alembic import command
+from app.database import AsyncSessionLocal, engine
+from app.models.project_place import ProjectPlace
+from app.models.travel_project import TravelProject
+from app.models.user import User
+from app.repositories.catalog_place import CatalogPlaceRepository
+from app.repositories.project_place import ProjectPlaceRepository
+from app.repositories.revoked_token import RevokedTokenRepository
+from app.repositories.travel_project import TravelProjectRepository
+from app.repositories.user import UserRepository
+from app.utils import PROJECT_ROOT
+
+
+BAD_PLAN = re.compile(r"^SCAN (?!\S+ VIRTUAL TABLE)|USE TEMP B-TREE")
+CHECKED_STATEMENTS = ("SELECT", "UPDATE", "DELETE")
+
+
+@pytest.fixture(scope="module")
+def migrated_database() -> None:
+    # No ini file: Alembic would otherwise reconfigure logging for the rest of the test session.
+    config = Config()
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    command.upgrade(config, "head")
+
+
+async def exercise_repositories() -> None:
+    """Call every repository method at least once, covering each filter and pagination variant."""
+    now = datetime.datetime.now(datetime.UTC)
+    async with AsyncSessionLocal() as session:
+        users = UserRepository(session)
+        projects = TravelProjectRepository(session)
+        places = ProjectPlaceRepository(session)
+        catalog = CatalogPlaceRepository(session)
+        revoked = RevokedTokenRepository(session)
+
+        user = await users.create(User(email="plans@example.com", password_hash="x"))
+        user_id = str(user.id)
+        await users.get_by_id(user_id)
+        await users.get_by_email(user.email)
+        await users.update(user, {"name": "Plans"})
+
+        project = await projects.create(TravelProject(user_id=user.id, name="Trip", description="Museums"))
+        project_id = str(project.id)
+        await projects.get_by_id(project_id)
+        await projects.get_for_user_by_id(user_id, project_id)
+        await projects.update(project, {"name": "Trip 2"})
+        await projects.apply_place_counts(project, places_delta=1, max_places=10)
+        for is_completed in (None, True, False):
+            _, cursor = await projects.list_for_user(user_id, limit=1, is_completed=is_completed)
+            await projects.list_for_user(user_id, limit=1, offset=1, is_completed=is_completed)
+            await projects.list_for_user(user_id, limit=1, cursor=cursor, is_completed=is_completed)
+        await projects.list_for_user(user_id, limit=1, q="trip")
+        await projects.list_for_user(user_id, limit=1, q="trip", is_completed=False)
+
+        place = await places.create(ProjectPlace(project_id=project.id, external_id=1, title="Place"))
+        await places.create_many([ProjectPlace(project_id=project.id, external_id=2, title="Place 2")])
+        await places.get_by_id(place.id)
+        await places.get_for_project_by_id(project_id, str(place.id))
+        await places.exists_external_in_project(project_id, 1)
+        await places.update(place, {"notes": "Notes"})
+        await places.set_visited(place, True)
+        for visited in (None, True, False):
+            _, cursor = await places.list_for_project(project_id, limit=1, visited=visited)
+            await places.list_for_project(project_id, limit=1, offset=1, visited=visited)
+            await places.list_for_project(project_id, limit=1, cursor=cursor, visited=visited)
+        await places.delete(await places.create(ProjectPlace(project_id=project.id, external_id=3)))
+        await session.flush()
+        await projects.get_for_user_with_places(user_id, project_id)
+
+        await catalog.upsert_many([{"external_id": 1, "title": "Paris", "api_link": None}], seen_at=now)
+        await catalog.get_many([1, 2])
+        await catalog.search("par", limit=10, offset=0)
+        await catalog.delete_not_seen_since(now)
+
+        await revoked.add(uuid4().hex, now + datetime.timedelta(days=1))
+        await revoked.list_active_after(0, now)
+        await revoked.delete_expired(now)
+
+        await projects.delete(project)
+        await projects.delete_by_id(project_id)
+        await users.delete_user(user)
+        await session.commit()
+
+
+@pytest.mark.anyio
+async def test_repository_queries_use_indexes(migrated_database) -> None:
+    statements: list[tuple[str, object]] = []
+
+    def record(_conn, _cursor, statement, parameters, _context, executemany) -> None:
+        if statement.lstrip().upper().startswith(CHECKED_STATEMENTS):
+            statements.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        await exercise_repositories()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    failures = []
+    try:
+        async with engine.connect() as conn:
+            for statement, parameters in statements:
+                plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                details = [row[-1] for row in plan]
+                if any(BAD_PLAN.search(detail) for detail in details):
+                    failures.append(f"{' '.join(statement.split())}\n  " + "\n  ".join(details))
+    finally:
+        await engine.dispose()
+
+    assert statements
+    assert not failures, "statements without a usable index:\n\n" + "\n\n".join(failures)